@@ -25,6 +25,14 @@ from android_env.components.simulators import base_simulator
 import numpy as np
 
 
+# Lift actions are sent on every reset, so the (constant) arrays are built once.
+# They are read-only so that consumers cannot accidentally modify them.
+_LIFT_ACTION_TYPE = np.array(action_type_lib.ActionType.LIFT)
+_LIFT_ACTION_TYPE.flags.writeable = False
+_LIFT_TOUCH_POSITION = np.array([0, 0])
+_LIFT_TOUCH_POSITION.flags.writeable = False
+
+
 def send_action_to_simulator(
     action: dict[str, np.ndarray],
     simulator: base_simulator.BaseSimulator,
@@ -46,8 +54,14 @@ def send_action_to_simulator(
     num_fingers: The number of fingers used in this simulator.
   """
 
+  # Unbox once to a plain `int` so that each `case` below compares Python
+  # integers instead of creating a new NumPy boolean per comparison.
+  action_type = action['action_type']
+  if isinstance(action_type, np.ndarray):
+    action_type = action_type.item(0)
+
   try:
-    match action['action_type']:
+    match action_type:
       # If the action is a TOUCH or LIFT, send a touch event to the simulator.
       case action_type_lib.ActionType.TOUCH | action_type_lib.ActionType.LIFT:
         prepared_action = _prepare_touch_action(
@@ -122,13 +136,13 @@ def lift_all_fingers_action(num_fingers: int) -> dict[str, np.ndarray]:
 
   # There's always at least one finger.
   lift_action = {
-      'action_type': np.array(action_type_lib.ActionType.LIFT),
-      'touch_position': np.array([0, 0]),
+      'action_type': _LIFT_ACTION_TYPE,
+      'touch_position': _LIFT_TOUCH_POSITION,
   }
   # Subsequent fingers have separate dict entries.
   for i in range(2, num_fingers + 1):
     lift_action |= {
-        f'action_type_{i}': np.array(action_type_lib.ActionType.LIFT),
-        f'touch_position_{i}': np.array([0, 0]),
+        f'action_type_{i}': _LIFT_ACTION_TYPE,
+        f'touch_position_{i}': _LIFT_TOUCH_POSITION,
     }
   return lift_action
@@ -247,6 +247,13 @@ class ActionFnsTest(parameterized.TestCase):
     for k, v in expected_action.items():
       np.testing.assert_array_equal(v, output[k])
 
+  def test_lift_all_fingers_action_is_read_only(self):
+    """The shared lift arrays cannot be modified by consumers."""
+
+    output = action_fns.lift_all_fingers_action(2)
+    for v in output.values():
+      self.assertFalse(v.flags.writeable)
+
 
 if __name__ == '__main__':
   absltest.main()
@@ -36,6 +36,26 @@ _BUTTON_TO_KEYCODE = {
     adb_pb2.AdbRequest.PressButton.Button.ENTER: 'KEYCODE_ENTER',
 }
 
+# A mapping from the `what` of a `pm list` request to the prefix that
+# `adb shell pm list` prepends to every output item.
+_PACKAGE_MANAGER_LIST_PREFIXES = {
+    'features': 'feature:',
+    'libraries': 'library:',
+    'packages': 'package:',
+}
+
+
+def list_packages_request() -> adb_pb2.AdbRequest:
+  """Returns a new request that lists all installed packages."""
+
+  return adb_pb2.AdbRequest(
+      package_manager=adb_pb2.AdbRequest.PackageManagerRequest(
+          list=adb_pb2.AdbRequest.PackageManagerRequest.List(
+              packages=adb_pb2.AdbRequest.PackageManagerRequest.List.Packages()
+          )
+      )
+  )
+
 
 class AdbCallParser:
   """Parses AdbRequest messages and executes corresponding adb commands."""
@@ -329,8 +349,10 @@ class AdbCallParser:
 
     force_stop = '-S' if request.start_activity.force_stop else ''
     response, command_output = self._execute_command(
-        ['shell', 'am', 'start', force_stop, '-W', '-n', activity] +
-        list(request.start_activity.extra_args or []),
+        [
+            'shell', 'am', 'start', force_stop, '-W', '-n', activity,
+            *request.start_activity.extra_args,
+        ],
         timeout=timeout)
 
     # Check command output for potential errors.
@@ -395,12 +417,7 @@ class AdbCallParser:
 
     # Get list of installed packages and issue an uninstall only if it's
     # already installed.
-    package_response = self._handle_package_manager(
-        adb_pb2.AdbRequest(
-            package_manager=adb_pb2.AdbRequest.PackageManagerRequest(
-                list=adb_pb2.AdbRequest.PackageManagerRequest.List(
-                    packages=adb_pb2.AdbRequest.PackageManagerRequest.List
-                    .Packages()))))
+    package_response = self._handle_package_manager(list_packages_request())
     if package_name in package_response.package_manager.list.items:
       response, _ = self._execute_command(['uninstall', package_name], timeout)
     else:
@@ -786,11 +803,7 @@ class AdbCallParser:
         if output:
           items = output.decode('utf-8').split()
           # Remove prefix for each item.
-          prefix = {
-              'features': 'feature:',
-              'libraries': 'library:',
-              'packages': 'package:',
-          }[what]
+          prefix = _PACKAGE_MANAGER_LIST_PREFIXES[what]
           items = [x[len(prefix) :] for x in items if x.startswith(prefix)]
           response.package_manager.list.items.extend(items)
         response.package_manager.output = output
@@ -828,6 +841,10 @@ class AdbCallParser:
               ['shell', 'pm', 'grant', grant.package_name, permission],
               timeout=timeout,
           )
+          # Stop at the first failure so that it is not masked by a later
+          # permission being granted successfully.
+          if response.status != adb_pb2.AdbResponse.Status.OK:
+            return response
 
     return response
 
@@ -896,7 +913,7 @@ class AdbCallParser:
       cmd.append(request.service)
 
     if request.args:
-      cmd += list(request.args)
+      cmd.extend(request.args)
 
     if request.proto:
       cmd.append('--proto')
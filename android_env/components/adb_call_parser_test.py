@@ -221,6 +221,22 @@ class AdbCallParserTest(parameterized.TestCase):
         mock.call(['shell', 'pm', 'grant', 'my.project', 'perm2'], None),
     ])
 
+  def test_grant_permissions_stops_at_first_failure(self):
+    adb = mock.create_autospec(adb_controller.AdbController)
+    adb.execute_command.side_effect = [
+        subprocess.TimeoutExpired(cmd='pm grant', timeout=1.0),
+        b'whatever',
+    ]
+    parser = adb_call_parser.AdbCallParser(adb)
+    request = adb_pb2.AdbRequest()
+    request.package_manager.grant.package_name = 'my.project'
+    request.package_manager.grant.permissions.extend(['perm1', 'perm2'])
+    response = parser.parse(request)
+    self.assertEqual(response.status, adb_pb2.AdbResponse.Status.TIMEOUT)
+    adb.execute_command.assert_called_once_with(
+        ['shell', 'pm', 'grant', 'my.project', 'perm1'], None
+    )
+
   def test_press_button_invalid_button(self):
     adb = mock.create_autospec(adb_controller.AdbController)
     parser = adb_call_parser.AdbCallParser(adb)
@@ -351,6 +367,14 @@ class AdbCallParserTest(parameterized.TestCase):
     self.assertEqual(response.status, adb_pb2.AdbResponse.Status.OK)
     self.assertEmpty(response.error_message)
 
+  def test_list_packages_request_returns_new_message(self):
+    request = adb_call_parser.list_packages_request()
+    self.assertEqual(
+        request.package_manager.list.WhichOneof('what'), 'packages')
+    # Modifying one request should not affect the next ones.
+    request.timeout_sec = 5
+    self.assertFalse(adb_call_parser.list_packages_request().timeout_sec)
+
   def test_uninstall_package_empty_package_name(self):
     adb = mock.create_autospec(adb_controller.AdbController)
     parser = adb_call_parser.AdbCallParser(adb)
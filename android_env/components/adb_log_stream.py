@@ -30,6 +30,7 @@ class AdbLogStream(log_stream.LogStream):
   def __init__(self, adb_command_prefix: list[str], verbose: bool = False):
     super().__init__(verbose=verbose)
     self._adb_command_prefix = adb_command_prefix
+    self._adb_subprocess = None
 
   def _get_stream_output(self):
 
@@ -50,7 +51,7 @@ class AdbLogStream(log_stream.LogStream):
     return self._adb_subprocess.stdout
 
   def stop_stream(self):
-    if not hasattr(self, '_adb_subprocess') or self._adb_subprocess is None:
+    if self._adb_subprocess is None:
       logging.error('`stop_stream()` called before `get_stream_output()`. '
                     'This violates the `LogStream` API.')
     else:
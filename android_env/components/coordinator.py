@@ -15,7 +15,6 @@
 
 """Coordinator handles interaction between internal components of AndroidEnv."""
 
-import copy
 import socket
 import time
 from typing import Any
@@ -107,7 +106,8 @@ class Coordinator:
 
     if self._config.periodic_restart_time_min and self._simulator_start_time:
       sim_alive_time = (time.time() - self._simulator_start_time) / 60.0
-      logging.info('Simulator has been running for %f mins', sim_alive_time)
+      # This runs on every reset, so only log it at a higher verbosity.
+      logging.vlog(1, 'Simulator has been running for %f mins', sim_alive_time)
       if sim_alive_time > self._config.periodic_restart_time_min:
         logging.info('Maximum alive time reached. Restarting simulator.')
         self._stats['relaunch_count_periodic'] += 1
@@ -251,8 +251,9 @@ class Coordinator:
   def _gather_simulator_signals(self) -> dict[str, np.ndarray]:
     """Gathers data from various sources to assemble the RL observation."""
 
-    # Get current timestamp and update the delta.
-    now = time.time()
+    # Get current timestamp and update the delta. Use a monotonic clock so that
+    # wall-clock adjustments (e.g. NTP) do not distort the reported timedelta.
+    now = time.monotonic()
     timestamp_delta = (
         0
         if self._latest_observation_time == 0
@@ -272,12 +273,12 @@ class Coordinator:
   def stats(self) -> dict[str, Any]:
     """Returns various statistics."""
 
-    return copy.deepcopy(self._stats)
+    return self._stats.copy()
 
   def close(self):
     """Cleans up the state of this Coordinator."""
 
-    if hasattr(self, '_task_manager'):
+    if self._task_manager is not None:
       self._task_manager.stop()
-    if hasattr(self, '_simulator'):
+    if self._simulator is not None:
       self._simulator.close()
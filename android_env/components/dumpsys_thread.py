@@ -56,6 +56,12 @@ class DumpsysThread:
     self._max_failed_activity_extraction = max_failed_current_activity
     self._num_failed_activity_extraction = 0
     self._latest_check: concurrent.futures.Future | None = None
+    # A single long-lived worker so that submitting a check never blocks the
+    # caller. Using a short-lived executor as a context manager would wait for
+    # the check to finish on exit, putting it back in the critical path.
+    self._executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix='dumpsys'
+    )
 
   def check_user_exited(self, timeout: float | None = None) -> bool:
     """Returns True if the user is not in the expected screen.
@@ -79,8 +85,7 @@ class DumpsysThread:
 
     # If the latest check is None, perform a check and return.
     if self._latest_check is None:
-      with concurrent.futures.ThreadPoolExecutor() as executor:
-        self._latest_check = executor.submit(self._check_impl)
+      self._latest_check = self._executor.submit(self._check_impl)
       return False
 
     # If there's a check in flight, continue only if it's finished.
@@ -91,6 +96,12 @@ class DumpsysThread:
     self._latest_check = None  # Reset the check.
     return v
 
+  def close(self) -> None:
+    """Shuts down the worker thread without waiting for pending checks."""
+
+    self._executor.shutdown(wait=False, cancel_futures=True)
+    self._latest_check = None
+
   def _check_impl(self) -> bool:
     """The synchronous implementation of Dumpsys."""
 
@@ -15,6 +15,7 @@
 
 """Tests for android_env.components.dumpsys_thread."""
 
+import threading
 from unittest import mock
 
 from absl.testing import absltest
@@ -56,6 +57,44 @@ class DumpsysThreadTest(absltest.TestCase):
     self.assertFalse(dumpsys.check_user_exited(timeout=1.0))
     self.assertFalse(dumpsys.check_user_exited(timeout=1.0))
 
+  def test_check_does_not_block_caller(self):
+    dumpsys = dumpsys_thread.DumpsysThread(
+        app_screen_checker=self._app_screen_checker, check_frequency=1)
+    check_can_finish = threading.Event()
+
+    def _slow_check():
+      check_can_finish.wait()
+      return screen_checker.AppScreenChecker.Outcome.UNEXPECTED_ACTIVITY
+
+    self._app_screen_checker.matches_current_app_screen.side_effect = (
+        _slow_check)
+    # Triggering the check should return immediately even though the check
+    # itself has not finished yet.
+    self.assertFalse(dumpsys.check_user_exited())
+    # Without a timeout, an unfinished check should not block either.
+    self.assertFalse(dumpsys.check_user_exited())
+    check_can_finish.set()
+    self.assertTrue(dumpsys.check_user_exited(timeout=1.0))
+
+  def test_close_does_not_wait_for_pending_check(self):
+    dumpsys = dumpsys_thread.DumpsysThread(
+        app_screen_checker=self._app_screen_checker, check_frequency=1)
+    check_can_finish = threading.Event()
+
+    def _slow_check():
+      check_can_finish.wait()
+      return screen_checker.AppScreenChecker.Outcome.SUCCESS
+
+    self._app_screen_checker.matches_current_app_screen.side_effect = (
+        _slow_check)
+    self.assertFalse(dumpsys.check_user_exited())
+    # Closing should return even though the check is still running.
+    dumpsys.close()
+    check_can_finish.set()
+    # The worker has been shut down, so no further checks can be scheduled.
+    with self.assertRaises(RuntimeError):
+      dumpsys.check_user_exited()
+
   def test_skipped(self):
     dumpsys = dumpsys_thread.DumpsysThread(
         app_screen_checker=self._app_screen_checker, check_frequency=5)
@@ -78,6 +117,8 @@ class DumpsysThreadTest(absltest.TestCase):
     # count to matches_current_app_screen() by 1), but it should return early.
     # The next 2 calls (16, 17) will hit the early exit from `check_frequency`.
     # In total there should be only two calls to `matches_current_app_screen()`.
+    # Checks run asynchronously, so wait for the one triggered by the 15th call.
+    dumpsys._latest_check.result(timeout=1.0)
     expected_call_count = 2
     self.assertEqual(
         self._app_screen_checker.matches_current_app_screen.call_count,
@@ -16,19 +16,46 @@
 """Utils for AndroidEnv."""
 
 from collections.abc import Sequence
+import functools
 
 from dm_env import specs
 import numpy as np
 
 
+# The `k` argument of `np.rot90()` that undoes each device orientation:
+# 0: PORTRAIT_0, 1: LANDSCAPE_90, 2: PORTRAIT_180, 3: LANDSCAPE_270.
+_ORIENTATION_TO_ROT90_K = {0: 0, 1: 3, 2: 2, 3: 1}
+
+
 def touch_position_to_pixel_position(
     touch_position: np.ndarray,
     width_height: Sequence[int],
 ) -> tuple[int, int]:
   """Maps touch position in [0,1] to the corresponding pixel on the screen."""
+  width_height, max_pixel = _screen_bounds(tuple(width_height))
   touch_pixels = (touch_position * width_height).astype(np.int32)
-  cap_idx = lambda v, idx_len: min(v, idx_len - 1)
-  return tuple(map(cap_idx, touch_pixels, width_height))
+  # Cap each coordinate to the last valid pixel index in a single ufunc call.
+  np.minimum(touch_pixels, max_pixel, out=touch_pixels)
+  return int(touch_pixels[0]), int(touch_pixels[1])
+
+
+@functools.lru_cache(maxsize=8)
+def _screen_bounds(
+    width_height: tuple[int, int],
+) -> tuple[np.ndarray, np.ndarray]:
+  """Returns `width_height` and the last valid pixel index as int32 arrays.
+
+  The screen size is constant for a whole episode, so the arrays are built once
+  per size and shared (read-only) between calls.
+
+  Args:
+    width_height: The (width, height) of the screen in pixels.
+  """
+  size = np.asarray(width_height, dtype=np.int32)
+  max_pixel = size - 1
+  size.flags.writeable = False
+  max_pixel.flags.writeable = False
+  return size, max_pixel
 
 
 def transpose_pixels(frame: np.ndarray) -> np.ndarray:
@@ -39,19 +66,19 @@ def transpose_pixels(frame: np.ndarray) -> np.ndarray:
 def orient_pixels(frame: np.ndarray, orientation: int) -> np.ndarray:
   """Rotates screen pixels according to the given orientation."""
 
-  match orientation:
-    case 0:  # PORTRAIT_90
-      return frame
-    case 1:  # LANDSCAPE_90
-      return np.rot90(frame, k=3, axes=(0, 1))
-    case 2:  # PORTRAIT_180
-      return np.rot90(frame, k=2, axes=(0, 1))
-    case 3:  # LANDSCAPE_270
-      return np.rot90(frame, k=1, axes=(0, 1))
-    case _:
-      raise ValueError(
-          'Orientation must be an integer in [0, 3] but is %r' % orientation
-      )
+  k = _ORIENTATION_TO_ROT90_K.get(orientation)
+  if k is None:
+    raise ValueError(
+        'Orientation must be an integer in [0, 3] but is %r' % orientation
+    )
+  if k == 0:  # Portrait frames need no rotation.
+    return frame
+  rotated = np.rot90(frame, k=k, axes=(0, 1))
+  if k == 2:  # A 180-degree view keeps rows contiguous, so no copy is needed.
+    return rotated
+  # Landscape views swap the row/column strides, which turns every later read
+  # into a strided gather. Pay for one contiguous copy up front instead.
+  return np.ascontiguousarray(rotated)
 
 
 def convert_int_to_float(data: np.ndarray, data_spec: specs.Array):
@@ -67,4 +94,9 @@ def convert_int_to_float(data: np.ndarray, data_spec: specs.Array):
     iinfo = np.iinfo(data_spec.dtype)
     value_min = iinfo.min
     value_max = iinfo.max
-  return np.float32(1.0 * (data - value_min) / (value_max - value_min))
+  # Compute directly in float32 and divide in place, so that only one
+  # output-sized array is allocated (instead of float64 temporaries + a cast).
+  # This also keeps `data - value_min` from overflowing for signed int data.
+  float_data = np.subtract(data, value_min, dtype=np.float32)
+  float_data /= np.subtract(value_max, value_min, dtype=np.float32)
+  return float_data
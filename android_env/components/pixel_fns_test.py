@@ -39,6 +39,13 @@ class UtilsTest(parameterized.TestCase):
         pixel_pos,
     )
 
+  def test_touch_position_to_pixel_position_returns_ints(self):
+    x, y = pixel_fns.touch_position_to_pixel_position(
+        np.array([0.5, 0.5], dtype=np.float32), (320, 480)
+    )
+    self.assertIsInstance(x, int)
+    self.assertIsInstance(y, int)
+
   def test_transpose_pixels(self):
     image = np.reshape(np.array(range(12)), (3, 2, 2))
     expected = [[[0, 1], [4, 5], [8, 9]], [[2, 3], [6, 7], [10, 11]]]
@@ -71,6 +78,16 @@ class UtilsTest(parameterized.TestCase):
     self.assertEqual(rotated.shape, (3, 2, 2))
     self.assertTrue((rotated == image).all())
 
+  @parameterized.parameters(1, 3)
+  def test_orient_pixels_landscape_is_contiguous(self, orientation):
+    image = np.zeros((3, 2, 2), dtype=np.uint8)
+    rotated = pixel_fns.orient_pixels(image, orientation)
+    self.assertTrue(rotated.flags.c_contiguous)
+
+  def test_orient_pixels_invalid_orientation(self):
+    image = np.zeros((3, 2, 2))
+    self.assertRaises(ValueError, pixel_fns.orient_pixels, image, 4)
+
   def test_convert_int_to_float_bounded_array(self):
     spec = specs.BoundedArray(
         shape=(4,),
@@ -102,6 +119,20 @@ class UtilsTest(parameterized.TestCase):
     np.testing.assert_equal(
         np.array([0.0, 128. / 255., 1.0], dtype=np.float32), float_data)
 
+  @parameterized.parameters(np.int8, np.int16)
+  def test_convert_int_to_float_signed_data_does_not_overflow(self, dtype):
+    # Subtracting the minimum must not wrap around in the (narrow) input dtype.
+    iinfo = np.iinfo(dtype)
+    spec = specs.Array(shape=(3,), dtype=dtype, name='signed_array')
+    data = np.array([iinfo.min, 0, iinfo.max], dtype=dtype)
+    float_data = pixel_fns.convert_int_to_float(data, spec)
+    self.assertEqual(float_data.dtype, np.float32)
+    np.testing.assert_allclose(
+        np.array([0.0, -iinfo.min / (iinfo.max - iinfo.min), 1.0],
+                 dtype=np.float32),
+        float_data,
+        rtol=1e-6)
+
 
 if __name__ == '__main__':
   absltest.main()
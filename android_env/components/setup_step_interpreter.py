@@ -16,7 +16,6 @@
 """A component that parses and processes SetupSteps."""
 
 from collections.abc import Sequence
-import copy
 import time
 from typing import Any
 
@@ -47,13 +46,13 @@ class SetupStepInterpreter:
     }
 
   def stats(self) -> dict[str, Any]:
-    return copy.deepcopy(self._stats)
+    return self._stats.copy()
 
   def interpret(self, setup_steps: Sequence[task_pb2.SetupStep]) -> None:
     """Returns True if parsing and processing `setup_steps` is successful."""
     if setup_steps:
-      logging.info('Executing setup steps: %s', setup_steps)
-      for step in setup_steps:
+      logging.info('Executing %d setup steps.', len(setup_steps))
+      for step in _coalesce_grant_steps(setup_steps):
         self._process_step_command(step)
       logging.info('Done executing setup steps.')
 
@@ -64,10 +63,14 @@ class SetupStepInterpreter:
       logging.info('Empty step_cmd')
       return
 
-    logging.info('Executing step_cmd: %r', step_cmd)
     step_type = step_cmd.WhichOneof('step')
     success_condition = step_cmd.success_condition
     success_check = success_condition.WhichOneof('check')
+    # Formatting a whole proto is expensive and noisy, so only summarize it at
+    # the default verbosity. The full message is logged with --v=1.
+    logging.info('Executing step_cmd: %s (success check: %s)',
+                 step_type, success_check)
+    logging.vlog(1, 'step_cmd: %r', step_cmd)
     assert step_type or success_check, (
         'At least one of step and success_condition must be defined.')
 
@@ -164,15 +167,11 @@ class SetupStepInterpreter:
     package = check_install.package_name
     logging.info('Checking if package is installed: [%r]', package)
 
-    request = adb_pb2.AdbRequest(
-        package_manager=adb_pb2.AdbRequest.PackageManagerRequest(
-            list=adb_pb2.AdbRequest.PackageManagerRequest.List(
-                packages=adb_pb2.AdbRequest.PackageManagerRequest.List.Packages(
-                ))))
-
     start_time = time.time()
     while time.time() - start_time < check_install.timeout_sec:
-      response = self._adb_call_parser.parse(request)
+      response = self._adb_call_parser.parse(
+          adb_call_parser_lib.list_packages_request()
+      )
       if package in response.package_manager.list.items:
         logging.info('Done confirming that package is installed.')
         return
@@ -180,3 +179,60 @@ class SetupStepInterpreter:
 
     logging.error('Package not found.')
     raise errors.CheckInstallError()
+
+
+def _grant_request(
+    step: task_pb2.SetupStep,
+) -> adb_pb2.AdbRequest.PackageManagerRequest.Grant | None:
+  """Returns the `pm grant` request of `step` if it is a plain grant step."""
+
+  if step.HasField('success_condition'):
+    return None
+  if step.WhichOneof('step') != 'adb_request':
+    return None
+  if step.adb_request.WhichOneof('command') != 'package_manager':
+    return None
+  package_manager = step.adb_request.package_manager
+  if package_manager.WhichOneof('verb') != 'grant':
+    return None
+  return package_manager.grant
+
+
+def _coalesce_grant_steps(
+    setup_steps: Sequence[task_pb2.SetupStep],
+) -> list[task_pb2.SetupStep]:
+  """Merges consecutive `pm grant` steps for the same package into one step.
+
+  Tasks commonly grant each permission in its own step, and every step pays for
+  an ADB round trip setup plus a fixed settling delay. Only steps without a
+  success condition and with the same package and timeout are merged. The given
+  `setup_steps` are not modified.
+
+  Args:
+    setup_steps: The steps to coalesce.
+
+  Returns:
+    The steps to execute, in order.
+  """
+
+  coalesced = []
+  for step in setup_steps:
+    grant = _grant_request(step)
+    previous_grant = _grant_request(coalesced[-1]) if coalesced else None
+    if (
+        grant is not None
+        and previous_grant is not None
+        and grant.package_name == previous_grant.package_name
+        and step.adb_request.timeout_sec
+        == coalesced[-1].adb_request.timeout_sec
+    ):
+      # Copy before merging so that the task's own steps are left untouched.
+      merged = task_pb2.SetupStep()
+      merged.CopyFrom(coalesced[-1])
+      merged.adb_request.package_manager.grant.permissions.extend(
+          grant.permissions
+      )
+      coalesced[-1] = merged
+      continue
+    coalesced.append(step)
+  return coalesced
@@ -15,10 +15,13 @@
 
 """Tests for android_env.components.setup_step_interpreter."""
 
+import functools
+import subprocess
 from unittest import mock
 
 from absl.testing import absltest
 from android_env.components import adb_call_parser
+from android_env.components import adb_controller
 from android_env.components import errors
 from android_env.components import setup_step_interpreter
 from android_env.proto import adb_pb2
@@ -27,10 +30,17 @@ from android_env.proto import task_pb2
 from google.protobuf import text_format
 
 
-def _to_proto(proto_class, text):
+@functools.cache
+def _serialized_proto(proto_class, text):
+  """Parses `text` once per unique literal and returns its binary form."""
   proto = proto_class()
   text_format.Parse(text, proto)
-  return proto
+  return proto.SerializeToString()
+
+
+def _to_proto(proto_class, text):
+  # Return a fresh message every time so that tests cannot affect each other.
+  return proto_class.FromString(_serialized_proto(proto_class, text))
 
 
 class SetupStepInterpreterTest(absltest.TestCase):
@@ -39,166 +49,191 @@ class SetupStepInterpreterTest(absltest.TestCase):
     super().setUp()
     self._parser = mock.create_autospec(
         adb_call_parser.AdbCallParser, instance=True)
+    self._interpreter = setup_step_interpreter.SetupStepInterpreter(
+        adb_call_parser=self._parser)
 
   def test_empty_setup_steps(self):
     """Simple test where nothing should break, and nothing should be done.
 
     The test simply expects this test to not crash.
     """
-    interpreter = setup_step_interpreter.SetupStepInterpreter(
-        adb_call_parser=self._parser)
-    interpreter.interpret([])
+    self._interpreter.interpret([])
 
   def test_none_setup_steps(self):
     """Simple test where nothing should break, and nothing should be done.
 
     The test simply expects this test to not crash.
     """
-    interpreter = setup_step_interpreter.SetupStepInterpreter(
-        adb_call_parser=self._parser)
     # Empty setup steps should be ignored.
-    interpreter.interpret([])
+    self._interpreter.interpret([])
 
   def test_invalid_setup_step(self):
-    interpreter = setup_step_interpreter.SetupStepInterpreter(
-        adb_call_parser=self._parser)
     # Empty setup steps should be ignored.
-    self.assertRaises(AssertionError, interpreter.interpret,
+    self.assertRaises(AssertionError, self._interpreter.interpret,
                       [task_pb2.SetupStep()])
 
   def test_adb_install_apk_filesystem(self):
     self._parser.parse.return_value = adb_pb2.AdbResponse(
         status=adb_pb2.AdbResponse.Status.OK)
-    interpreter = setup_step_interpreter.SetupStepInterpreter(
-        adb_call_parser=self._parser)
-    interpreter.interpret([
-        _to_proto(
-            task_pb2.SetupStep, """
-adb_request: {
-  install_apk: {
-    filesystem: {
-      path: "/my/favorite/dir/my_apk.apk"
-    }
-  }
-}""")
-    ])
-    self._parser.parse.assert_called_once_with(
-        adb_pb2.AdbRequest(
-            install_apk=adb_pb2.AdbRequest.InstallApk(
-                filesystem=adb_pb2.AdbRequest.InstallApk.Filesystem(
-                    path='/my/favorite/dir/my_apk.apk'))))
+    request = adb_pb2.AdbRequest(
+        install_apk=adb_pb2.AdbRequest.InstallApk(
+            filesystem=adb_pb2.AdbRequest.InstallApk.Filesystem(
+                path='/my/favorite/dir/my_apk.apk')))
+    self._interpreter.interpret([task_pb2.SetupStep(adb_request=request)])
+    self._parser.parse.assert_called_once_with(request)
 
   def test_adb_force_stop(self):
     self._parser.parse.return_value = adb_pb2.AdbResponse(
         status=adb_pb2.AdbResponse.Status.OK)
-    interpreter = setup_step_interpreter.SetupStepInterpreter(
-        adb_call_parser=self._parser)
-    interpreter.interpret([
-        _to_proto(
-            task_pb2.SetupStep, """
-adb_request: { force_stop: { package_name: "my.app.Activity" } }""")
-    ])
-    self._parser.parse.assert_called_once_with(
-        adb_pb2.AdbRequest(
-            force_stop=adb_pb2.AdbRequest.ForceStop(
-                package_name='my.app.Activity')))
+    request = adb_pb2.AdbRequest(
+        force_stop=adb_pb2.AdbRequest.ForceStop(
+            package_name='my.app.Activity'))
+    self._interpreter.interpret([task_pb2.SetupStep(adb_request=request)])
+    self._parser.parse.assert_called_once_with(request)
 
   def test_adb_start_activity(self):
     self._parser.parse.return_value = adb_pb2.AdbResponse(
         status=adb_pb2.AdbResponse.Status.OK)
-    interpreter = setup_step_interpreter.SetupStepInterpreter(
-        adb_call_parser=self._parser)
-    interpreter.interpret([
-        _to_proto(
-            task_pb2.SetupStep, """
-adb_request: {
-  start_activity: {
-    full_activity: "my.app.Activity"
-    extra_args: "arg1"
-    extra_args: "arg2"
-  }
-}""")
-    ])
-    self._parser.parse.assert_called_once_with(
-        adb_pb2.AdbRequest(
-            start_activity=adb_pb2.AdbRequest.StartActivity(
-                full_activity='my.app.Activity', extra_args=['arg1', 'arg2'])))
+    request = adb_pb2.AdbRequest(
+        start_activity=adb_pb2.AdbRequest.StartActivity(
+            full_activity='my.app.Activity', extra_args=['arg1', 'arg2']))
+    self._interpreter.interpret([task_pb2.SetupStep(adb_request=request)])
+    self._parser.parse.assert_called_once_with(request)
 
   def test_adb_single_tap(self):
     self._parser.parse.return_value = adb_pb2.AdbResponse(
         status=adb_pb2.AdbResponse.Status.OK)
-    interpreter = setup_step_interpreter.SetupStepInterpreter(
-        adb_call_parser=self._parser)
-    interpreter.interpret([
-        _to_proto(task_pb2.SetupStep, """
-adb_request: {
-  tap: {
-    x: 321
-    y: 654
-  }
-}""")
-    ])
-    self._parser.parse.assert_called_once_with(
-        adb_pb2.AdbRequest(tap=adb_pb2.AdbRequest.Tap(x=321, y=654)))
+    request = adb_pb2.AdbRequest(tap=adb_pb2.AdbRequest.Tap(x=321, y=654))
+    self._interpreter.interpret([task_pb2.SetupStep(adb_request=request)])
+    self._parser.parse.assert_called_once_with(request)
 
   def test_adb_press_button(self):
     self._parser.parse.return_value = adb_pb2.AdbResponse(
         status=adb_pb2.AdbResponse.Status.OK)
-    interpreter = setup_step_interpreter.SetupStepInterpreter(
-        adb_call_parser=self._parser)
-    interpreter.interpret([
-        _to_proto(task_pb2.SetupStep,
-                  """ adb_request: { press_button: { button: HOME } }""")
-    ])
-    self._parser.parse.assert_called_once_with(
-        adb_pb2.AdbRequest(
-            press_button=adb_pb2.AdbRequest.PressButton(
-                button=adb_pb2.AdbRequest.PressButton.Button.HOME)))
+    request = adb_pb2.AdbRequest(
+        press_button=adb_pb2.AdbRequest.PressButton(
+            button=adb_pb2.AdbRequest.PressButton.Button.HOME))
+    self._interpreter.interpret([task_pb2.SetupStep(adb_request=request)])
+    self._parser.parse.assert_called_once_with(request)
 
     self._parser.reset_mock()
-    interpreter.interpret([
-        _to_proto(task_pb2.SetupStep,
-                  """ adb_request: { press_button: { button: BACK } }""")
-    ])
-    self._parser.parse.assert_called_once_with(
-        adb_pb2.AdbRequest(
-            press_button=adb_pb2.AdbRequest.PressButton(
-                button=adb_pb2.AdbRequest.PressButton.Button.BACK)))
+    request = adb_pb2.AdbRequest(
+        press_button=adb_pb2.AdbRequest.PressButton(
+            button=adb_pb2.AdbRequest.PressButton.Button.BACK))
+    self._interpreter.interpret([task_pb2.SetupStep(adb_request=request)])
+    self._parser.parse.assert_called_once_with(request)
 
   def test_adb_start_screen_pinning(self):
     self._parser.parse.return_value = adb_pb2.AdbResponse(
         status=adb_pb2.AdbResponse.Status.OK)
-    interpreter = setup_step_interpreter.SetupStepInterpreter(
-        adb_call_parser=self._parser)
-    interpreter.interpret([
-        _to_proto(
-            task_pb2.SetupStep, """
+    request = adb_pb2.AdbRequest(
+        start_screen_pinning=adb_pb2.AdbRequest.StartScreenPinning(
+            full_activity='my.app.HighlanderApp'))  # "There can be only one".
+    self._interpreter.interpret([task_pb2.SetupStep(adb_request=request)])
+    self._parser.parse.assert_called_once_with(request)
+
+  @mock.patch('time.sleep')
+  def test_consecutive_grants_are_merged(self, unused_mock_sleep):
+    self._parser.parse.return_value = adb_pb2.AdbResponse(
+        status=adb_pb2.AdbResponse.Status.OK)
+    grant_step = """
 adb_request: {
-  start_screen_pinning: {
-    full_activity: "my.app.HighlanderApp"  # "There can be only one".
+  package_manager: {
+    grant: { package_name: "my.app" permissions: "%s" }
   }
-}""")
-    ])
+}"""
+    steps = [
+        _to_proto(task_pb2.SetupStep, grant_step % 'perm.A'),
+        _to_proto(task_pb2.SetupStep, grant_step % 'perm.B'),
+        _to_proto(task_pb2.SetupStep, grant_step % 'perm.C'),
+    ]
+    self._interpreter.interpret(steps)
     self._parser.parse.assert_called_once_with(
         adb_pb2.AdbRequest(
-            start_screen_pinning=adb_pb2.AdbRequest.StartScreenPinning(
-                full_activity='my.app.HighlanderApp')))
+            package_manager=adb_pb2.AdbRequest.PackageManagerRequest(
+                grant=adb_pb2.AdbRequest.PackageManagerRequest.Grant(
+                    package_name='my.app',
+                    permissions=['perm.A', 'perm.B', 'perm.C'],
+                ))))
+    # The given steps should not be modified.
+    self.assertEqual(
+        list(steps[0].adb_request.package_manager.grant.permissions),
+        ['perm.A'])
 
   @mock.patch('time.sleep')
-  def test_time_sleep(self, mock_sleep):
+  def test_merged_grant_fails_if_any_permission_fails(self, unused_mock_sleep):
+    adb = mock.create_autospec(adb_controller.AdbController)
+
+    def _execute_command(args, timeout=None):
+      del timeout
+      if args[-1] == 'perm.A':
+        raise subprocess.TimeoutExpired(cmd=args, timeout=1.0)
+      return b''
+
+    adb.execute_command.side_effect = _execute_command
     interpreter = setup_step_interpreter.SetupStepInterpreter(
-        adb_call_parser=self._parser)
-    interpreter.interpret(
+        adb_call_parser=adb_call_parser.AdbCallParser(adb)
+    )
+    grant_step = """
+adb_request: {
+  package_manager: {
+    grant: { package_name: "my.app" permissions: "%s" }
+  }
+}"""
+    # A failure to grant `perm.A` must not be hidden by `perm.B` succeeding.
+    with self.assertRaises(errors.StepCommandError):
+      interpreter.interpret([
+          _to_proto(task_pb2.SetupStep, grant_step % 'perm.A'),
+          _to_proto(task_pb2.SetupStep, grant_step % 'perm.B'),
+      ])
+
+  @mock.patch('time.sleep')
+  def test_grants_for_different_packages_are_not_merged(
+      self, unused_mock_sleep):
+    self._parser.parse.return_value = adb_pb2.AdbResponse(
+        status=adb_pb2.AdbResponse.Status.OK)
+    grant_step = """
+adb_request: {
+  package_manager: {
+    grant: { package_name: "%s" permissions: "perm.A" }
+  }
+}"""
+    self._interpreter.interpret([
+        _to_proto(task_pb2.SetupStep, grant_step % 'my.app'),
+        _to_proto(task_pb2.SetupStep, grant_step % 'other.app'),
+    ])
+    self.assertEqual(self._parser.parse.call_count, 2)
+
+  @mock.patch('time.sleep')
+  def test_failed_step_stops_later_steps(self, unused_mock_sleep):
+    self._parser.parse.return_value = adb_pb2.AdbResponse(
+        status=adb_pb2.AdbResponse.Status.ADB_ERROR)
+    install_step = """
+adb_request: { install_apk: { filesystem: { path: "%s" } } }"""
+    with self.assertRaises(errors.StepCommandError):
+      self._interpreter.interpret([
+          _to_proto(task_pb2.SetupStep, install_step % '/my/bad.apk'),
+          _to_proto(task_pb2.SetupStep, install_step % '/my/good.apk'),
+      ])
+    # Only the failing step should have been tried (3 times).
+    installed_paths = [
+        call.args[0].install_apk.filesystem.path
+        for call in self._parser.parse.call_args_list
+    ]
+    self.assertEqual(installed_paths, ['/my/bad.apk'] * 3)
+    self.assertEqual(self._interpreter.stats()['error_count_adb_request'], 3)
+
+  @mock.patch('time.sleep')
+  def test_time_sleep(self, mock_sleep):
+    self._interpreter.interpret(
         [_to_proto(task_pb2.SetupStep, """sleep: { time_sec: 0.875 }""")])
     assert mock_sleep.call_count == 2
     mock_sleep.assert_has_calls([mock.call(0.875), mock.call(0.5)])
 
   @mock.patch('time.sleep')
   def test_wait_for_app_screen_empty_activity(self, unused_mock_sleep):
-    interpreter = setup_step_interpreter.SetupStepInterpreter(
-        adb_call_parser=self._parser)
     with self.assertRaises(errors.StepCommandError):
-      interpreter.interpret([
+      self._interpreter.interpret([
           _to_proto(task_pb2.SetupStep,
                     """success_condition: {wait_for_app_screen: { }}""")
       ])
@@ -211,10 +246,8 @@ adb_request: {
                 'com.some.package',
                 'not.what.you.are.looking.for',
             ])))
-    interpreter = setup_step_interpreter.SetupStepInterpreter(
-        adb_call_parser=self._parser)
     with self.assertRaises(errors.StepCommandError):
-      interpreter.interpret([
+      self._interpreter.interpret([
           _to_proto(
               task_pb2.SetupStep, """
 success_condition: {
@@ -233,10 +266,8 @@ success_condition: {
                 'com.some.package',
                 'baz',
             ])))
-    interpreter = setup_step_interpreter.SetupStepInterpreter(
-        adb_call_parser=self._parser)
     # The test checks that this command raises no AssertionError.
-    interpreter.interpret([
+    self._interpreter.interpret([
         _to_proto(
             task_pb2.SetupStep, """
 success_condition: {
@@ -254,10 +285,8 @@ success_condition: {
                 list=adb_pb2.AdbResponse.PackageManagerResponse.List(
                     items=[]))),
     ] * 3
-    interpreter = setup_step_interpreter.SetupStepInterpreter(
-        adb_call_parser=self._parser)
     with self.assertRaises(errors.StepCommandError):
-      interpreter.interpret([
+      self._interpreter.interpret([
           _to_proto(
               task_pb2.SetupStep, """
 success_condition: {
@@ -292,9 +321,7 @@ success_condition: {
             package_manager=adb_pb2.AdbResponse.PackageManagerResponse(
                 list=adb_pb2.AdbResponse.PackageManagerResponse.List(items=[])))
     ]
-    interpreter = setup_step_interpreter.SetupStepInterpreter(
-        adb_call_parser=self._parser)
-    interpreter.interpret([
+    self._interpreter.interpret([
         _to_proto(
             task_pb2.SetupStep, """
 success_condition: {
@@ -321,9 +348,7 @@ success_condition: {
                     'bar',
                 ]))),
     ]
-    interpreter = setup_step_interpreter.SetupStepInterpreter(
-        adb_call_parser=self._parser)
-    interpreter.interpret([
+    self._interpreter.interpret([
         _to_proto(
             task_pb2.SetupStep, """
 success_condition: {
@@ -189,10 +189,10 @@ class InteractionThread(threading.Thread):
     self._screenshot = self._get_screenshot_fn()
 
   def run(self):
-    last_read = time.time()
+    last_read = time.monotonic()
     while not self._should_stop.is_set():
       self._screenshot = self._get_screenshot_fn()
-      now = time.time()
+      now = time.monotonic()
       elapsed = now - last_read
       last_read = now
       sleep_time = self._interaction_rate_sec - elapsed
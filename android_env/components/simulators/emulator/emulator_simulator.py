@@ -41,6 +41,15 @@ from google.protobuf import empty_pb2
 
 _DEFAULT_SNAPSHOT_NAME: str = 'default_snapshot'
 
+# How often to poll the emulator's status while waiting for it to boot.
+_BOOT_POLL_INTERVAL_SEC: float = 1.0
+
+# Maps key event names (e.g. 'keydown') to their proto enum values. Built once
+# since `send_key()` is on the per-step action path.
+_KEY_EVENT_TYPES: dict[str, int] = dict(
+    emulator_controller_pb2.KeyboardEvent.KeyEventType.items()
+)
+
 
 def _is_existing_emulator_provided(
     launcher_config: config_classes.EmulatorLauncherConfig,
@@ -122,10 +131,12 @@ class EmulatorSimulator(base_simulator.BaseSimulator):
         None
     )
     self._snapshot_stub = None
-    # Set the image format to RGBA. The width and height of the returned
-    # screenshots will use the device's width and height.
+    # Set the image format to RGB. The width and height of the returned
+    # screenshots will use the device's width and height. Asking for RGB (rather
+    # than RGBA) lets us return a contiguous frame without dropping the alpha
+    # channel through a strided view.
     self._image_format = emulator_controller_pb2.ImageFormat(
-        format=emulator_controller_pb2.ImageFormat.ImgFormat.RGBA8888)
+        format=emulator_controller_pb2.ImageFormat.ImgFormat.RGB888)
 
     if (
         self._config.launch_n_times_without_reboot
@@ -366,19 +377,21 @@ class EmulatorSimulator(base_simulator.BaseSimulator):
     assert (
         self._emulator_stub is not None
     ), 'Emulator stub has not been initialized yet.'
-    start_time = time.time()
+    start_time = time.monotonic()
     deadline = start_time + startup_wait_time_sec
     success = False
-    while time.time() < deadline:
+    logging.info('Waiting for emulator (%r) to start...', self.adb_device_name())
+    while (remaining_sec := deadline - time.monotonic()) > 0:
       emu_status = self._emulator_stub.getStatus(empty_pb2.Empty())
-      logging.info('Waiting for emulator (%r) to start... (%rms)',
+      # Status is polled often, so only log every poll with --v=1.
+      logging.vlog(1, 'Waiting for emulator (%r) to start... (%rms)',
                    self.adb_device_name(), emu_status.uptime)
       if emu_status.booted:
         success = True
         break
-      time.sleep(5.0)
+      time.sleep(min(_BOOT_POLL_INTERVAL_SEC, remaining_sec))
 
-    elapsed_time = time.time() - start_time
+    elapsed_time = time.monotonic() - start_time
     if not success:
       raise EmulatorCrashError(
           f'The emulator failed to boot after {startup_wait_time_sec} seconds')
@@ -424,10 +437,12 @@ class EmulatorSimulator(base_simulator.BaseSimulator):
       event_type: Type of key event to be sent.
     """
 
-    event_types = emulator_controller_pb2.KeyboardEvent.KeyEventType.keys()
-    if event_type not in event_types:
+    key_event_type = _KEY_EVENT_TYPES.get(event_type)
+    if key_event_type is None:
       raise ValueError(
-          f'Event type must be one of {event_types} but is {event_type}.')
+          f'Event type must be one of {list(_KEY_EVENT_TYPES)} but is '
+          f'{event_type}.'
+      )
 
     assert (
         self._emulator_stub is not None
@@ -435,9 +450,7 @@ class EmulatorSimulator(base_simulator.BaseSimulator):
     self._emulator_stub.sendKey(
         emulator_controller_pb2.KeyboardEvent(
             codeType=emulator_controller_pb2.KeyboardEvent.KeyCodeType.XKB,
-            eventType=emulator_controller_pb2.KeyboardEvent.KeyEventType.Value(
-                event_type
-            ),
+            eventType=key_event_type,
             keyCode=int(keycode),
         )
     )
@@ -452,9 +465,9 @@ class EmulatorSimulator(base_simulator.BaseSimulator):
     assert self._image_format, 'ImageFormat has not been initialized yet.'
     image_proto = self._emulator_stub.getScreenshot(self._image_format)
     h, w = image_proto.format.height, image_proto.format.width
-    image = np.frombuffer(image_proto.image, dtype='uint8', count=h * w * 4)
-    image.shape = (h, w, 4)
-    return image[:, :, :3]
+    image = np.frombuffer(image_proto.image, dtype='uint8', count=h * w * 3)
+    image.shape = (h, w, 3)
+    return image
 
   @_reconnect_on_grpc_error
   def _shutdown_emulator(self):
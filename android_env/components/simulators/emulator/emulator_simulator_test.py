@@ -308,13 +308,19 @@ class EmulatorSimulatorTest(absltest.TestCase):
     simulator._emulator_stub.getScreenshot = mock.MagicMock(
         return_value=emulator_controller_pb2.Image(
             format=emulator_controller_pb2.ImageFormat(width=5678, height=1234),
-            image=Image.new('RGBA', (1234, 5678)).tobytes(),
+            image=Image.new('RGB', (1234, 5678)).tobytes(),
             timestampUs=123))
 
     screenshot = simulator.get_screenshot()
     # The screenshot should have the same screen dimensions as reported by ADB
     # and it should have 3 channels (RGB).
     self.assertEqual(screenshot.shape, (1234, 5678, 3))
+    self.assertTrue(screenshot.flags.c_contiguous)
+    simulator._emulator_stub.getScreenshot.assert_called_once_with(
+        emulator_controller_pb2.ImageFormat(
+            format=emulator_controller_pb2.ImageFormat.ImgFormat.RGB888
+        )
+    )
 
   def test_load_state(self):
     config = config_classes.EmulatorConfig(
@@ -538,6 +544,47 @@ class EmulatorSimulatorTest(absltest.TestCase):
             ))
     ])
 
+  @mock.patch.object(time, 'sleep', autospec=True)
+  def test_confirm_booted_polls_until_booted(self, mock_sleep):
+    config = config_classes.EmulatorConfig(
+        emulator_launcher=config_classes.EmulatorLauncherConfig(
+            grpc_port=1234, tmp_dir=self.create_tempdir().full_path
+        ),
+        adb_controller=config_classes.AdbControllerConfig(
+            adb_path='/my/adb',
+            adb_server_port=5037,
+        ),
+    )
+    simulator = emulator_simulator.EmulatorSimulator(config)
+    simulator.launch()
+
+    simulator._emulator_stub.getStatus = mock.MagicMock(
+        side_effect=[
+            emulator_controller_pb2.EmulatorStatus(booted=False),
+            emulator_controller_pb2.EmulatorStatus(booted=False),
+            emulator_controller_pb2.EmulatorStatus(booted=True),
+        ]
+    )
+    simulator._confirm_booted()
+
+    self.assertEqual(simulator._emulator_stub.getStatus.call_count, 3)
+    mock_sleep.assert_has_calls([mock.call(1.0), mock.call(1.0)])
+
+  def test_send_key_invalid_event_type(self):
+    config = config_classes.EmulatorConfig(
+        emulator_launcher=config_classes.EmulatorLauncherConfig(
+            grpc_port=1234, tmp_dir=self.create_tempdir().full_path
+        ),
+        adb_controller=config_classes.AdbControllerConfig(
+            adb_path='/my/adb',
+            adb_server_port=5037,
+        ),
+    )
+    simulator = emulator_simulator.EmulatorSimulator(config)
+    simulator.launch()
+
+    self.assertRaises(ValueError, simulator.send_key, 123, 'keysideways')
+
 
 if __name__ == '__main__':
   absltest.main()
@@ -21,23 +21,32 @@ from dm_env import specs
 import numpy as np
 
 
+_NUM_ACTION_TYPES = len(action_type.ActionType)
+
+# Bounds of every `touch_position` spec. They are shared (read-only) so that
+# building action specs does not convert the same lists over and over.
+_TOUCH_POSITION_MINIMUM = np.array([0.0, 0.0], dtype=np.float32)
+_TOUCH_POSITION_MINIMUM.flags.writeable = False
+_TOUCH_POSITION_MAXIMUM = np.array([1.0, 1.0], dtype=np.float32)
+_TOUCH_POSITION_MAXIMUM.flags.writeable = False
+
 _PROTO_DTYPE_TO_NUMPY_DTYPE = {
-    task_pb2.ArraySpec.DataType.FLOAT: np.float32,
-    task_pb2.ArraySpec.DataType.DOUBLE: np.float64,
-    task_pb2.ArraySpec.DataType.INT8: np.int8,
-    task_pb2.ArraySpec.DataType.INT16: np.int16,
-    task_pb2.ArraySpec.DataType.INT32: np.int32,
-    task_pb2.ArraySpec.DataType.INT64: np.int64,
-    task_pb2.ArraySpec.DataType.UINT8: np.uint8,
-    task_pb2.ArraySpec.DataType.UINT16: np.uint16,
-    task_pb2.ArraySpec.DataType.UINT32: np.uint32,
-    task_pb2.ArraySpec.DataType.UINT64: np.uint64,
-    task_pb2.ArraySpec.DataType.BOOL: np.bool_,
-    task_pb2.ArraySpec.DataType.STRING_U1: np.dtype(('U1')),
-    task_pb2.ArraySpec.DataType.STRING_U16: np.dtype(('<U16')),
-    task_pb2.ArraySpec.DataType.STRING_U25: np.dtype(('<U25')),
-    task_pb2.ArraySpec.DataType.STRING_U250: np.dtype(('<U250')),
-    task_pb2.ArraySpec.DataType.STRING: np.dtype(('<U0')),
+    task_pb2.ArraySpec.DataType.FLOAT: np.dtype(np.float32),
+    task_pb2.ArraySpec.DataType.DOUBLE: np.dtype(np.float64),
+    task_pb2.ArraySpec.DataType.INT8: np.dtype(np.int8),
+    task_pb2.ArraySpec.DataType.INT16: np.dtype(np.int16),
+    task_pb2.ArraySpec.DataType.INT32: np.dtype(np.int32),
+    task_pb2.ArraySpec.DataType.INT64: np.dtype(np.int64),
+    task_pb2.ArraySpec.DataType.UINT8: np.dtype(np.uint8),
+    task_pb2.ArraySpec.DataType.UINT16: np.dtype(np.uint16),
+    task_pb2.ArraySpec.DataType.UINT32: np.dtype(np.uint32),
+    task_pb2.ArraySpec.DataType.UINT64: np.dtype(np.uint64),
+    task_pb2.ArraySpec.DataType.BOOL: np.dtype(np.bool_),
+    task_pb2.ArraySpec.DataType.STRING_U1: np.dtype('U1'),
+    task_pb2.ArraySpec.DataType.STRING_U16: np.dtype('<U16'),
+    task_pb2.ArraySpec.DataType.STRING_U25: np.dtype('<U25'),
+    task_pb2.ArraySpec.DataType.STRING_U250: np.dtype('<U250'),
+    task_pb2.ArraySpec.DataType.STRING: np.dtype('<U0'),
     task_pb2.ArraySpec.DataType.OBJECT: np.dtype('O'),
 }
 
@@ -63,7 +72,7 @@ def base_action_spec(
     touch_position_i: Touch position for additional fingers (i>1).
   """
 
-  num_actions = len(action_type.ActionType) if enable_key_events else 3
+  num_actions = _NUM_ACTION_TYPES if enable_key_events else 3
 
   action_spec = {
       'action_type':
@@ -72,8 +81,8 @@ def base_action_spec(
           specs.BoundedArray(
               shape=(2,),
               dtype=np.float32,
-              minimum=[0.0, 0.0],
-              maximum=[1.0, 1.0],
+              minimum=_TOUCH_POSITION_MINIMUM,
+              maximum=_TOUCH_POSITION_MAXIMUM,
               name='touch_position'),
   }
 
@@ -81,14 +90,14 @@ def base_action_spec(
     action_spec.update({
         f'action_type_{i}':
             specs.DiscreteArray(
-                num_values=len(action_type.ActionType),
+                num_values=_NUM_ACTION_TYPES,
                 name=f'action_type_{i}'),
         f'touch_position_{i}':
             specs.BoundedArray(
                 shape=(2,),
                 dtype=np.float32,
-                minimum=[0.0, 0.0],
-                maximum=[1.0, 1.0],
+                minimum=_TOUCH_POSITION_MINIMUM,
+                maximum=_TOUCH_POSITION_MAXIMUM,
                 name=f'touch_position_{i}'),
     })
 
@@ -130,7 +139,7 @@ def base_observation_spec(height: int, width: int) -> dict[str, specs.Array]:
           specs.Array(shape=(), dtype=np.int64, name='timedelta'),
       'orientation':
           specs.BoundedArray(
-              shape=np.array([4]),
+              shape=(4,),
               dtype=np.uint8,
               name='orientation',
               minimum=0,
@@ -17,11 +17,11 @@
 
 import ast
 from collections.abc import Callable
-import copy
-import datetime
+import dataclasses
 import json
 import re
 import threading
+import time
 from typing import Any
 
 from absl import logging
@@ -37,9 +37,42 @@ import dm_env
 import numpy as np
 
 
+@dataclasses.dataclass(slots=True)
+class _Stats:
+  """Counters about the task that are reported by `TaskManager.stats()`."""
+
+  episode_steps: int = 0
+  reset_count_step_timeout: int = 0
+  reset_count_user_exited: int = 0
+  reset_count_episode_end: int = 0
+  reset_count_max_duration_reached: int = 0
+  restart_count_max_bad_states: int = 0
+  task_updates: int = 0
+
+
 class TaskManager:
   """Handles all events and information related to the task."""
 
+  # Many of these attributes are read on every step, so avoid a per-instance
+  # `__dict__`. New attributes must be added here.
+  __slots__ = (
+      '_bad_state_counter',
+      '_compiled_regexps',
+      '_config',
+      '_dumpsys_thread',
+      '_is_bad_episode',
+      '_latest_values',
+      '_lock',
+      '_logcat_thread',
+      '_max_episode_sec',
+      '_max_episode_steps',
+      '_setup_step_interpreter',
+      '_should_restart',
+      '_stats',
+      '_task',
+      '_task_start_time',
+  )
+
   def __init__(
       self,
       task: task_pb2.Task,
@@ -54,26 +87,25 @@ class TaskManager:
 
     self._task = task
     self._config = config or config_classes.TaskManagerConfig()
+    # Episode limits are checked on every step, so read them from the proto once.
+    self._max_episode_steps = task.max_episode_steps
+    self._max_episode_sec = task.max_episode_sec
     self._lock = threading.Lock()
     self._logcat_thread = None
     self._dumpsys_thread = None
     self._setup_step_interpreter = None
+    # Compiled logcat regexps, keyed by their source. The task does not change,
+    # so patterns are compiled once and reused whenever logcat is restarted.
+    self._compiled_regexps: dict[str, re.Pattern[str]] = {}
 
     # Initialize stats.
-    self._stats = {
-        'episode_steps': 0,
-        'reset_count_step_timeout': 0,
-        'reset_count_user_exited': 0,
-        'reset_count_episode_end': 0,
-        'reset_count_max_duration_reached': 0,
-        'restart_count_max_bad_states': 0,
-        'task_updates': 0,
-    }
+    self._stats = _Stats()
 
     # Initialize internal state
     self._task_start_time = None
     self._bad_state_counter = 0
     self._is_bad_episode = False
+    self._should_restart = False
 
     self._latest_values = {
         'reward': 0.0,
@@ -89,7 +121,12 @@ class TaskManager:
 
     This method is expected to be called after setup_task() has been called.
     """
-    output = copy.deepcopy(self._stats)
+    # All counters are plain numbers, so a shallow copy is enough. Unlike
+    # `dataclasses.asdict()`, this does not deep-copy every value.
+    output = {
+        field.name: getattr(self._stats, field.name)
+        for field in dataclasses.fields(self._stats)
+    }
     if self._setup_step_interpreter is not None:
       output.update(self._setup_step_interpreter.stats())
     return output
@@ -101,6 +138,7 @@ class TaskManager:
   def stop(self) -> None:
     """Suspends task processing."""
     self._stop_logcat_thread()
+    self._stop_dumpsys_thread()
 
   def start(
       self,
@@ -125,7 +163,7 @@ class TaskManager:
       self._bad_state_counter = 0
     self._is_bad_episode = False
 
-    self._task_start_time = datetime.datetime.now()
+    self._task_start_time = time.monotonic()
     with self._lock:
       self._latest_values = {
           'reward': 0.0,
@@ -137,7 +175,7 @@ class TaskManager:
   def rl_reset(self, observation: dict[str, Any]) -> dm_env.TimeStep:
     """Performs one RL step."""
 
-    self._stats['episode_steps'] = 0
+    self._stats.episode_steps = 0
 
     self._logcat_thread.line_ready().wait()
     with self._lock:
@@ -154,7 +192,7 @@ class TaskManager:
   def rl_step(self, observation: dict[str, Any]) -> dm_env.TimeStep:
     """Performs one RL step."""
 
-    self._stats['episode_steps'] += 1
+    self._stats.episode_steps += 1
 
     self._logcat_thread.line_ready().wait()
     with self._lock:
@@ -174,9 +212,11 @@ class TaskManager:
 
   def _get_current_extras(self) -> dict[str, Any]:
     """Returns task extras accumulated since the last step."""
-    extras = {}
-    for name, values in self._latest_values['extra'].items():
-      extras[name] = np.stack(values)
+    latest_extras = self._latest_values['extra']
+    # Most steps have no extras, in which case there is nothing to reset.
+    if not latest_extras:
+      return {}
+    extras = {name: np.stack(values) for name, values in latest_extras.items()}
     self._latest_values['extra'] = {}
     return extras
 
@@ -184,34 +224,35 @@ class TaskManager:
     """Determines the type of RL transition will be used."""
 
     # Check if user existed the task
-    if self._dumpsys_thread.check_user_exited():
+    if (
+        self._dumpsys_thread is not None
+        and self._dumpsys_thread.check_user_exited()
+    ):
       self._increment_bad_state()
-      self._stats['reset_count_user_exited'] += 1
+      self._stats.reset_count_user_exited += 1
       logging.warning('User exited the task. Truncating the episode.')
-      logging.info('************* END OF EPISODE *************')
       return dm_env.truncation
 
     # Check if episode has ended
     if self._latest_values['episode_end']:
-      self._stats['reset_count_episode_end'] += 1
+      self._stats.reset_count_episode_end += 1
       logging.info('End of episode from logcat! Ending episode.')
       return dm_env.termination
 
     # Check if step limit or time limit has been reached
-    if self._task.max_episode_steps > 0:
-      if self._stats['episode_steps'] > self._task.max_episode_steps:
-        self._stats['reset_count_max_duration_reached'] += 1
+    if self._max_episode_steps > 0:
+      if self._stats.episode_steps > self._max_episode_steps:
+        self._stats.reset_count_max_duration_reached += 1
         logging.info('Maximum task duration (%r steps) reached. '
-                     'Truncating the episode.', self._task.max_episode_steps)
+                     'Truncating the episode.', self._max_episode_steps)
         return dm_env.truncation
 
-    if self._task.max_episode_sec > 0.0:
-      task_duration = datetime.datetime.now() - self._task_start_time
-      max_episode_sec = self._task.max_episode_sec
-      if task_duration > datetime.timedelta(seconds=int(max_episode_sec)):
-        self._stats['reset_count_max_duration_reached'] += 1
+    if self._max_episode_sec > 0.0:
+      task_duration = time.monotonic() - self._task_start_time
+      if task_duration > self._max_episode_sec:
+        self._stats.reset_count_max_duration_reached += 1
         logging.info('Maximum task duration (%r sec) reached. '
-                     'Truncating the episode.', max_episode_sec)
+                     'Truncating the episode.', self._max_episode_sec)
         return dm_env.truncation
 
     return dm_env.transition
@@ -230,6 +271,13 @@ class TaskManager:
 
   def _start_dumpsys_thread(self,
                             adb_call_parser: adb_call_parser_lib.AdbCallParser):
+    self._stop_dumpsys_thread()
+    # A non-positive frequency disables dumpsys checks altogether, so there is
+    # no need to create the checker nor to call it on every step.
+    if self._config.dumpsys_check_frequency <= 0:
+      self._dumpsys_thread = None
+      return
+
     self._dumpsys_thread = dumpsys_thread.DumpsysThread(
         app_screen_checker=app_screen_checker.AppScreenChecker(
             adb_call_parser=adb_call_parser,
@@ -239,6 +287,11 @@ class TaskManager:
         max_failed_current_activity=self._config.max_failed_current_activity,
     )
 
+  def _stop_dumpsys_thread(self):
+    if self._dumpsys_thread is not None:
+      self._dumpsys_thread.close()
+      self._dumpsys_thread = None
+
   def _stop_logcat_thread(self):
     if self._logcat_thread is not None:
       self._logcat_thread.kill()
@@ -259,15 +312,23 @@ class TaskManager:
       logging.warning('Bad state counter: %d.', self._bad_state_counter)
       if self._bad_state_counter >= self._config.max_bad_states:
         logging.error('Too many consecutive bad states. Restarting simulator.')
-        self._stats['restart_count_max_bad_states'] += 1
+        self._stats.restart_count_max_bad_states += 1
         self._should_restart = True
     else:
       logging.warning('Max bad states not set, bad states will be ignored.')
 
+  def _compile_regexp(self, regexp: str) -> re.Pattern[str]:
+    """Returns the compiled `regexp`, compiling it only on first use."""
+
+    # Defaults to 'a^' since that regex matches no string by definition.
+    regexp = regexp or 'a^'
+    if regexp not in self._compiled_regexps:
+      self._compiled_regexps[regexp] = re.compile(regexp)
+    return self._compiled_regexps[regexp]
+
   def _logcat_listeners(self):
     """Creates list of EventListeners for logcat thread."""
 
-    # Defaults to 'a^' since that regex matches no string by definition.
     regexps = self._task.log_parsing_config.log_regexps
     listeners = []
 
@@ -280,7 +341,7 @@ class TaskManager:
 
     for regexp in regexps.reward:
       listeners.append(logcat_thread.EventListener(
-          regexp=re.compile(regexp or 'a^'),
+          regexp=self._compile_regexp(regexp),
           handler_fn=_reward_handler))
 
     # RewardEvent listeners
@@ -294,7 +355,7 @@ class TaskManager:
         return _reward_event_handler
 
       listeners.append(logcat_thread.EventListener(
-          regexp=re.compile(reward_event.event or 'a^'),
+          regexp=self._compile_regexp(reward_event.event),
           handler_fn=get_reward_event_handler(reward_event.reward)))
 
     # Score listener
@@ -307,7 +368,7 @@ class TaskManager:
         self._latest_values['reward'] += current_reward
 
     listeners.append(logcat_thread.EventListener(
-        regexp=re.compile(regexps.score or 'a^'),
+        regexp=self._compile_regexp(regexps.score),
         handler_fn=_score_handler))
 
     # Episode end listeners
@@ -318,7 +379,7 @@ class TaskManager:
 
     for regexp in regexps.episode_end:
       listeners.append(logcat_thread.EventListener(
-          regexp=re.compile(regexp or 'a^'),
+          regexp=self._compile_regexp(regexp),
           handler_fn=_episode_end_handler))
 
     # Extra listeners
@@ -346,7 +407,7 @@ class TaskManager:
 
     for regexp in regexps.extra:
       listeners.append(logcat_thread.EventListener(
-          regexp=re.compile(regexp or 'a^'),
+          regexp=self._compile_regexp(regexp),
           handler_fn=_extras_handler))
 
     # JSON extra listeners
@@ -363,7 +424,7 @@ class TaskManager:
 
     for regexp in regexps.json_extra:
       listeners.append(logcat_thread.EventListener(
-          regexp=re.compile(regexp or 'a^'),
+          regexp=self._compile_regexp(regexp),
           handler_fn=_json_extras_handler))
 
     def _process_extra(extra_name, extra):
@@ -16,10 +16,13 @@
 """Tests for android_env.components.task_manager.py."""
 
 import json
+import re
+import time
 from unittest import mock
 
 from absl.testing import absltest
 from android_env.components import adb_call_parser as adb_call_parser_lib
+from android_env.components import config_classes
 from android_env.components import dumpsys_thread
 from android_env.components import log_stream
 from android_env.components import logcat_thread
@@ -33,27 +36,29 @@ class TaskManagerTest(absltest.TestCase):
 
   def setUp(self):
     super().setUp()
-    self.addCleanup(mock.patch.stopall)  # Disable previous patches.
-
     self._setup_step_interpreter = mock.create_autospec(
         setup_step_interpreter.SetupStepInterpreter)
     self._dumpsys_thread = mock.create_autospec(dumpsys_thread.DumpsysThread)
     self._logcat_thread = mock.create_autospec(logcat_thread.LogcatThread)
     self._log_stream = mock.create_autospec(log_stream.LogStream)
 
-    mock.patch.object(
-        setup_step_interpreter,
-        'SetupStepInterpreter',
-        return_value=self._setup_step_interpreter).start()
-    mock.patch.object(
-        dumpsys_thread, 'DumpsysThread',
-        return_value=self._dumpsys_thread).start()
-    mock.patch.object(
-        logcat_thread, 'LogcatThread',
-        return_value=self._logcat_thread).start()
-    mock.patch.object(
-        log_stream, 'LogStream',
-        return_value=self._log_stream).start()
+    self.enter_context(
+        mock.patch.object(
+            setup_step_interpreter,
+            'SetupStepInterpreter',
+            return_value=self._setup_step_interpreter))
+    self.enter_context(
+        mock.patch.object(
+            dumpsys_thread, 'DumpsysThread',
+            return_value=self._dumpsys_thread))
+    self.enter_context(
+        mock.patch.object(
+            logcat_thread, 'LogcatThread',
+            return_value=self._logcat_thread))
+    self.enter_context(
+        mock.patch.object(
+            log_stream, 'LogStream',
+            return_value=self._log_stream))
 
   def test_start(self):
     task_mgr = task_manager.TaskManager(task=task_pb2.Task())
@@ -63,6 +68,69 @@ class TaskManagerTest(absltest.TestCase):
     self.assertIsNotNone(task_mgr._dumpsys_thread)
     self.assertIsNotNone(task_mgr._setup_step_interpreter)
 
+  def test_start_without_dumpsys_checks(self):
+    task_mgr = task_manager.TaskManager(
+        task=task_pb2.Task(),
+        config=config_classes.TaskManagerConfig(dumpsys_check_frequency=0),
+    )
+    adb_call_parser = mock.create_autospec(adb_call_parser_lib.AdbCallParser)
+    task_mgr.start(lambda: adb_call_parser, log_stream=self._log_stream)
+    self.assertIsNone(task_mgr._dumpsys_thread)
+    dumpsys_thread.DumpsysThread.assert_not_called()
+    # Steps should not need the dumpsys thread.
+    timestep = task_mgr.rl_step(observation={})
+    self.assertTrue(timestep.mid())
+
+  def test_stop_closes_dumpsys_thread(self):
+    task_mgr = task_manager.TaskManager(task=task_pb2.Task())
+    adb_call_parser = mock.create_autospec(adb_call_parser_lib.AdbCallParser)
+    task_mgr.start(lambda: adb_call_parser, log_stream=self._log_stream)
+    task_mgr.stop()
+    self._dumpsys_thread.close.assert_called_once()
+    self.assertIsNone(task_mgr._dumpsys_thread)
+
+  def test_restart_closes_previous_dumpsys_thread(self):
+    task_mgr = task_manager.TaskManager(task=task_pb2.Task())
+    adb_call_parser = mock.create_autospec(adb_call_parser_lib.AdbCallParser)
+    task_mgr.start(lambda: adb_call_parser, log_stream=self._log_stream)
+    self._dumpsys_thread.close.assert_not_called()
+    task_mgr.start(lambda: adb_call_parser, log_stream=self._log_stream)
+    self._dumpsys_thread.close.assert_called_once()
+
+  def test_regexps_are_compiled_once_across_restarts(self):
+    task = task_pb2.Task()
+    task.log_parsing_config.log_regexps.episode_end.extend(['^Game over$'])
+    task_mgr = task_manager.TaskManager(task=task)
+    adb_call_parser = mock.create_autospec(adb_call_parser_lib.AdbCallParser)
+
+    with mock.patch.object(re, 'compile', wraps=re.compile) as mock_compile:
+      task_mgr.start(lambda: adb_call_parser, log_stream=self._log_stream)
+      task_mgr.stop()
+      task_mgr.start(lambda: adb_call_parser, log_stream=self._log_stream)
+
+    mock_compile.assert_any_call('^Game over$')
+    self.assertEqual(
+        mock_compile.call_args_list.count(mock.call('^Game over$')), 1)
+
+  @mock.patch.object(time, 'monotonic', autospec=True)
+  def test_max_episode_sec(self, mock_monotonic):
+    task = task_pb2.Task(max_episode_sec=1.5)
+    task_mgr = task_manager.TaskManager(task=task)
+    self._dumpsys_thread.check_user_exited.return_value = False
+    adb_call_parser = mock.create_autospec(adb_call_parser_lib.AdbCallParser)
+    task_mgr.start(lambda: adb_call_parser, log_stream=self._log_stream)
+    task_mgr.setup_task()
+
+    mock_monotonic.return_value = 100.0
+    task_mgr.reset_task()
+    task_mgr.rl_reset(observation={})
+    # Fractional limits are respected, i.e. they are not truncated to 1s.
+    mock_monotonic.return_value = 101.2
+    self.assertTrue(task_mgr.rl_step(observation={}).mid())
+    mock_monotonic.return_value = 101.6
+    self.assertTrue(task_mgr.rl_step(observation={}).last())
+    self.assertEqual(task_mgr.stats()['reset_count_max_duration_reached'], 1)
+
   def test_setup_task(self):
     task_mgr = task_manager.TaskManager(task=task_pb2.Task())
     adb_call_parser = mock.create_autospec(adb_call_parser_lib.AdbCallParser)
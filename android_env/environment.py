@@ -117,7 +117,7 @@ class AndroidEnv(env_interface.AndroidEnvInterface):
     """Cleans up running processes, threads and local files."""
     if not self._is_closed:
       logging.info('Cleaning up AndroidEnv...')
-      if hasattr(self, '_coordinator'):
+      if self._coordinator is not None:
         self._coordinator.close()
       logging.info('Done cleaning up AndroidEnv.')
       self._is_closed = True
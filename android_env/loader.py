@@ -36,8 +36,14 @@ def _load_task(task_config: config_classes.TaskConfig) -> task_pb2.Task:
   task = task_pb2.Task()
   match task_config:
     case config_classes.FilesystemTaskConfig():
-      with open(task_config.path, 'r') as proto_file:
-        text_format.Parse(proto_file.read(), task)
+      if task_config.path.endswith('.binarypb'):
+        # Binary protos are parsed by the C++ backend, which is much faster
+        # than the pure Python text format parser.
+        with open(task_config.path, 'rb') as proto_file:
+          task.ParseFromString(proto_file.read())
+      else:
+        with open(task_config.path, 'r') as proto_file:
+          text_format.Parse(proto_file.read(), task)
     case _:
       logging.error('Unsupported TaskConfig: %r', task_config)
 
@@ -177,6 +177,44 @@ max_episode_sec: 0
     mock_task_manager.assert_called_with(expected_task)
     self.assertIsInstance(env, env_interface.AndroidEnvInterface)
 
+  @mock.patch.object(task_manager_lib, 'TaskManager', autospec=True)
+  @mock.patch.object(emulator_simulator, 'EmulatorSimulator', autospec=True)
+  @mock.patch.object(coordinator_lib, 'Coordinator', autospec=True)
+  @mock.patch.object(builtins, 'open', autospec=True)
+  def test_binary_task(
+      self, mock_open, mock_coordinator, mock_simulator, mock_task_manager
+  ):
+
+    # Arrange.
+    del mock_coordinator, mock_simulator
+    expected_task = task_pb2.Task()
+    expected_task.id = 'fake_task'
+    expected_task.name = 'Fake Task'
+    expected_task.description = 'Task for testing loader.'
+    mock_open.return_value.__enter__ = mock_open
+    mock_open.return_value.read.return_value = (
+        expected_task.SerializeToString()
+    )
+    config = config_classes.AndroidEnvConfig(
+        task=config_classes.FilesystemTaskConfig(path='some/task.binarypb'),
+        simulator=config_classes.EmulatorConfig(
+            emulator_launcher=config_classes.EmulatorLauncherConfig(
+                avd_name='my_avd'
+            ),
+            adb_controller=config_classes.AdbControllerConfig(
+                adb_path='~/Android/Sdk/platform-tools/adb',
+            ),
+        ),
+    )
+
+    # Act.
+    env = loader.load(config)
+
+    # Assert.
+    mock_open.assert_any_call('some/task.binarypb', 'rb')
+    mock_task_manager.assert_called_with(expected_task)
+    self.assertIsInstance(env, env_interface.AndroidEnvInterface)
+
 
 if __name__ == '__main__':
   absltest.main()
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: android_env/proto/a11y/android_accessibility_forest.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'android_env/proto/a11y/android_accessibility_forest.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from android_env.proto.a11y import android_accessibility_window_info_pb2 as android__env_dot_proto_dot_a11y_dot_android__accessibility__window__info__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n9android_env/proto/a11y/android_accessibility_forest.proto\x12\x0b\x61ndroid_env\x1a>android_env/proto/a11y/android_accessibility_window_info.proto\"Z\n\x1a\x41ndroidAccessibilityForest\x12<\n\x07windows\x18\x01 \x03(\x0b\x32+.android_env.AndroidAccessibilityWindowInfoB0\n,com.google.androidenv.accessibilityforwarderP\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'android_env.proto.a11y.android_accessibility_forest_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n,com.google.androidenv.accessibilityforwarderP\001'
+  _globals['_ANDROIDACCESSIBILITYFOREST']._serialized_start=138
+  _globals['_ANDROIDACCESSIBILITYFOREST']._serialized_end=228
+# @@protoc_insertion_point(module_scope)
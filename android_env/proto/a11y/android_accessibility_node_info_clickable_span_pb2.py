@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: android_env/proto/a11y/android_accessibility_node_info_clickable_span.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'android_env/proto/a11y/android_accessibility_node_info_clickable_span.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\nKandroid_env/proto/a11y/android_accessibility_node_info_clickable_span.proto\x12\x0b\x61ndroid_env\"\xfc\x01\n)AndroidAccessibilityNodeInfoClickableSpan\x12\x0c\n\x04text\x18\x01 \x01(\t\x12\x0b\n\x03url\x18\x02 \x01(\t\x12Q\n\x06source\x18\x03 \x01(\x0e\x32\x41.android_env.AndroidAccessibilityNodeInfoClickableSpan.SpanSource\x12\r\n\x05start\x18\x04 \x01(\x05\x12\x0f\n\x07node_id\x18\x05 \x01(\x05\"A\n\nSpanSource\x12\x10\n\x0cUNKNOWN_TYPE\x10\x00\x12\x08\n\x04TEXT\x10\x01\x12\x17\n\x13\x43ONTENT_DESCRIPTION\x10\x02\x42\x30\n,com.google.androidenv.accessibilityforwarderP\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'android_env.proto.a11y.android_accessibility_node_info_clickable_span_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n,com.google.androidenv.accessibilityforwarderP\001'
+  _globals['_ANDROIDACCESSIBILITYNODEINFOCLICKABLESPAN']._serialized_start=93
+  _globals['_ANDROIDACCESSIBILITYNODEINFOCLICKABLESPAN']._serialized_end=345
+  _globals['_ANDROIDACCESSIBILITYNODEINFOCLICKABLESPAN_SPANSOURCE']._serialized_start=280
+  _globals['_ANDROIDACCESSIBILITYNODEINFOCLICKABLESPAN_SPANSOURCE']._serialized_end=345
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: android_env/proto/a11y/android_accessibility_window_info.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'android_env/proto/a11y/android_accessibility_window_info.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from android_env.proto.a11y import android_accessibility_tree_pb2 as android__env_dot_proto_dot_a11y_dot_android__accessibility__tree__pb2
+from android_env.proto.a11y import rect_pb2 as android__env_dot_proto_dot_a11y_dot_rect__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n>android_env/proto/a11y/android_accessibility_window_info.proto\x12\x0b\x61ndroid_env\x1a\x37\x61ndroid_env/proto/a11y/android_accessibility_tree.proto\x1a!android_env/proto/a11y/rect.proto\"\xa0\x04\n\x1e\x41ndroidAccessibilityWindowInfo\x12\x30\n\x10\x62ounds_in_screen\x18\x01 \x01(\x0b\x32\x16.android_env.ProtoRect\x12\x12\n\ndisplay_id\x18\x02 \x01(\x05\x12\n\n\x02id\x18\x03 \x01(\x05\x12\r\n\x05layer\x18\x04 \x01(\x05\x12\r\n\x05title\x18\x05 \x01(\t\x12K\n\x0bwindow_type\x18\x06 \x01(\x0e\x32\x36.android_env.AndroidAccessibilityWindowInfo.WindowType\x12 \n\x18is_accessibility_focused\x18\x07 \x01(\x08\x12\x11\n\tis_active\x18\x08 \x01(\x08\x12\x12\n\nis_focused\x18\t \x01(\x08\x12%\n\x1dis_in_picture_in_picture_mode\x18\n \x01(\x08\x12\x33\n\x04tree\x18\x0b \x01(\x0b\x32%.android_env.AndroidAccessibilityTree\"\x9b\x01\n\nWindowType\x12\x10\n\x0cUNKNOWN_TYPE\x10\x00\x12\x14\n\x10TYPE_APPLICATION\x10\x01\x12\x15\n\x11TYPE_INPUT_METHOD\x10\x02\x12\x0f\n\x0bTYPE_SYSTEM\x10\x03\x12\x1e\n\x1aTYPE_ACCESSIBILITY_OVERLAY\x10\x04\x12\x1d\n\x19TYPE_SPLIT_SCREEN_DIVIDER\x10\x05\x42\x30\n,com.google.androidenv.accessibilityforwarderP\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'android_env.proto.a11y.android_accessibility_window_info_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n,com.google.androidenv.accessibilityforwarderP\001'
+  _globals['_ANDROIDACCESSIBILITYWINDOWINFO']._serialized_start=172
+  _globals['_ANDROIDACCESSIBILITYWINDOWINFO']._serialized_end=716
+  _globals['_ANDROIDACCESSIBILITYWINDOWINFO_WINDOWTYPE']._serialized_start=561
+  _globals['_ANDROIDACCESSIBILITYWINDOWINFO_WINDOWTYPE']._serialized_end=716
+# @@protoc_insertion_point(module_scope)
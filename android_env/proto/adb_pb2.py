@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: android_env/proto/adb.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'android_env/proto/adb.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1b\x61ndroid_env/proto/adb.proto\x12\x0b\x61ndroid_env\"\x83\x1c\n\nAdbRequest\x12\x39\n\x0binstall_apk\x18\x01 \x01(\x0b\x32\".android_env.AdbRequest.InstallApkH\x00\x12?\n\x0estart_activity\x18\x02 \x01(\x0b\x32%.android_env.AdbRequest.StartActivityH\x00\x12\x37\n\nforce_stop\x18\x03 \x01(\x0b\x32!.android_env.AdbRequest.ForceStopH\x00\x12*\n\x03tap\x18\x06 \x01(\x0b\x32\x1b.android_env.AdbRequest.TapH\x00\x12;\n\x0cpress_button\x18\x07 \x01(\x0b\x32#.android_env.AdbRequest.PressButtonH\x00\x12J\n\x14start_screen_pinning\x18\n \x01(\x0b\x32*.android_env.AdbRequest.StartScreenPinningH\x00\x12\x45\n\x11uninstall_package\x18\x10 \x01(\x0b\x32(.android_env.AdbRequest.UninstallPackageH\x00\x12J\n\x14get_current_activity\x18\x11 \x01(\x0b\x32*.android_env.AdbRequest.GetCurrentActivityH\x00\x12H\n\x0fget_orientation\x18\x18 \x01(\x0b\x32-.android_env.AdbRequest.GetOrientationRequestH\x00\x12,\n\x04push\x18\x12 \x01(\x0b\x32\x1c.android_env.AdbRequest.PushH\x00\x12,\n\x04pull\x18\x13 \x01(\x0b\x32\x1c.android_env.AdbRequest.PullH\x00\x12\x37\n\ninput_text\x18\x14 \x01(\x0b\x32!.android_env.AdbRequest.InputTextH\x00\x12;\n\x08settings\x18\x15 \x01(\x0b\x32\'.android_env.AdbRequest.SettingsRequestH\x00\x12\x39\n\x07generic\x18\x16 \x01(\x0b\x32&.android_env.AdbRequest.GenericRequestH\x00\x12H\n\x0fpackage_manager\x18\x17 \x01(\x0b\x32-.android_env.AdbRequest.PackageManagerRequestH\x00\x12\x39\n\x07\x64umpsys\x18\x1a \x01(\x0b\x32&.android_env.AdbRequest.DumpsysRequestH\x00\x12?\n\x0esend_broadcast\x18\x19 \x01(\x0b\x32%.android_env.AdbRequest.SendBroadcastH\x00\x12\x13\n\x0btimeout_sec\x18\x64 \x01(\x02\x1a\xcc\x01\n\nInstallApk\x12\x43\n\nfilesystem\x18\x02 \x01(\x0b\x32-.android_env.AdbRequest.InstallApk.FilesystemH\x00\x12\x37\n\x04\x62lob\x18\x06 \x01(\x0b\x32\'.android_env.AdbRequest.InstallApk.BlobH\x00\x1a\x1a\n\nFilesystem\x12\x0c\n\x04path\x18\x01 \x01(\t\x1a\x18\n\x04\x42lob\x12\x10\n\x08\x63ontents\x18\x01 \x01(\x0c\x42\n\n\x08location\x1aN\n\rStartActivity\x12\x15\n\rfull_activity\x18\x01 \x01(\t\x12\x12\n\nextra_args\x18\x02 \x03(\t\x12\x12\n\nforce_stop\x18\x03 \x01(\x08\x1a\x32\n\rSendBroadcast\x12\x0e\n\x06\x61\x63tion\x18\x01 \x01(\t\x12\x11\n\tcomponent\x18\x02 \x01(\t\x1a(\n\x10UninstallPackage\x12\x14\n\x0cpackage_name\x18\x01 \x01(\t\x1a!\n\tForceStop\x12\x14\n\x0cpackage_name\x18\x01 \x01(\t\x1a\x1b\n\x03Tap\x12\t\n\x01x\x18\x01 \x01(\x05\x12\t\n\x01y\x18\x02 \x01(\x05\x1ar\n\x0bPressButton\x12:\n\x06\x62utton\x18\x01 \x01(\x0e\x32*.android_env.AdbRequest.PressButton.Button\"\'\n\x06\x42utton\x12\x08\n\x04HOME\x10\x00\x12\x08\n\x04\x42\x41\x43K\x10\x01\x12\t\n\x05\x45NTER\x10\x02\x1a+\n\x12StartScreenPinning\x12\x15\n\rfull_activity\x18\x01 \x01(\t\x1a\x14\n\x12GetCurrentActivity\x1a\x17\n\x15GetOrientationRequest\x1a%\n\x04Push\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c\x12\x0c\n\x04path\x18\x02 \x01(\t\x1a\x14\n\x04Pull\x12\x0c\n\x04path\x18\x01 \x01(\t\x1a\x19\n\tInputText\x12\x0c\n\x04text\x18\x01 \x01(\t\x1a\xea\x05\n\x0fSettingsRequest\x12\x45\n\nname_space\x18\x01 \x01(\x0e\x32\x31.android_env.AdbRequest.SettingsRequest.Namespace\x12:\n\x03get\x18\x02 \x01(\x0b\x32+.android_env.AdbRequest.SettingsRequest.GetH\x00\x12:\n\x03put\x18\x03 \x01(\x0b\x32+.android_env.AdbRequest.SettingsRequest.PutH\x00\x12\x44\n\ndelete_key\x18\x04 \x01(\x0b\x32..android_env.AdbRequest.SettingsRequest.DeleteH\x00\x12>\n\x05reset\x18\x05 \x01(\x0b\x32-.android_env.AdbRequest.SettingsRequest.ResetH\x00\x12<\n\x04list\x18\x06 \x01(\x0b\x32,.android_env.AdbRequest.SettingsRequest.ListH\x00\x1a\x12\n\x03Get\x12\x0b\n\x03key\x18\x01 \x01(\t\x1a!\n\x03Put\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\x1a\x15\n\x06\x44\x65lete\x12\x0b\n\x03key\x18\x01 \x01(\t\x1a\xb7\x01\n\x05Reset\x12\x14\n\x0cpackage_name\x18\x01 \x01(\t\x12@\n\x04mode\x18\x02 \x01(\x0e\x32\x32.android_env.AdbRequest.SettingsRequest.Reset.Mode\"V\n\x04Mode\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x16\n\x12UNTRUSTED_DEFAULTS\x10\x01\x12\x13\n\x0fUNTRUSTED_CLEAR\x10\x02\x12\x14\n\x10TRUSTED_DEFAULTS\x10\x03\x1a\x06\n\x04List\"<\n\tNamespace\x12\x0b\n\x07UNKNOWN\x10\x00\x12\n\n\x06SYSTEM\x10\x01\x12\n\n\x06SECURE\x10\x02\x12\n\n\x06GLOBAL\x10\x03\x42\x06\n\x04verb\x1a\x1e\n\x0eGenericRequest\x12\x0c\n\x04\x61rgs\x18\x01 \x03(\t\x1a\x9f\x05\n\x15PackageManagerRequest\x12\x42\n\x04list\x18\x01 \x01(\x0b\x32\x32.android_env.AdbRequest.PackageManagerRequest.ListH\x00\x12\x44\n\x05\x63lear\x18\x02 \x01(\x0b\x32\x33.android_env.AdbRequest.PackageManagerRequest.ClearH\x00\x12\x44\n\x05grant\x18\x03 \x01(\x0b\x32\x33.android_env.AdbRequest.PackageManagerRequest.GrantH\x00\x1a\xc9\x02\n\x04List\x12O\n\x08\x66\x65\x61tures\x18\x01 \x01(\x0b\x32;.android_env.AdbRequest.PackageManagerRequest.List.FeaturesH\x00\x12Q\n\tlibraries\x18\x02 \x01(\x0b\x32<.android_env.AdbRequest.PackageManagerRequest.List.LibrariesH\x00\x12O\n\x08packages\x18\x03 \x01(\x0b\x32;.android_env.AdbRequest.PackageManagerRequest.List.PackagesH\x00\x1a\n\n\x08\x46\x65\x61tures\x1a\x0b\n\tLibraries\x1a+\n\x08Packages\x12\x0e\n\x06\x66ilter\x18\x01 \x01(\t\x12\x0f\n\x07options\x18\x02 \x03(\tB\x06\n\x04what\x1a.\n\x05\x43lear\x12\x14\n\x0cpackage_name\x18\x01 \x01(\t\x12\x0f\n\x07user_id\x18\x02 \x01(\t\x1a\x32\n\x05Grant\x12\x14\n\x0cpackage_name\x18\x01 \x01(\t\x12\x13\n\x0bpermissions\x18\x02 \x03(\tB\x06\n\x04verb\x1a\xa6\x02\n\x0e\x44umpsysRequest\x12\x0f\n\x07service\x18\x01 \x01(\t\x12\x0c\n\x04\x61rgs\x18\x02 \x03(\t\x12\x11\n\tlist_only\x18\x03 \x01(\x08\x12\x13\n\x0btimeout_sec\x18\x04 \x01(\x05\x12\x12\n\ntimeout_ms\x18\x05 \x01(\x05\x12\x0b\n\x03pid\x18\x06 \x01(\x08\x12\r\n\x05proto\x18\x07 \x01(\x08\x12\x46\n\x08priority\x18\x08 \x01(\x0e\x32\x34.android_env.AdbRequest.DumpsysRequest.PriorityLevel\x12\x15\n\rskip_services\x18\t \x03(\t\">\n\rPriorityLevel\x12\t\n\x05UNSET\x10\x00\x12\n\n\x06NORMAL\x10\x01\x12\x08\n\x04HIGH\x10\x02\x12\x0c\n\x08\x43RITICAL\x10\x03\x42\t\n\x07\x63ommand\"\xb2\x0c\n\x0b\x41\x64\x62Response\x12/\n\x06status\x18\x01 \x01(\x0e\x32\x1f.android_env.AdbResponse.Status\x12\x15\n\rerror_message\x18\x02 \x01(\t\x12\x32\n\x05stats\x18\x03 \x03(\x0b\x32#.android_env.AdbResponse.StatsEntry\x12S\n\x14get_current_activity\x18\n \x01(\x0b\x32\x33.android_env.AdbResponse.GetCurrentActivityResponseH\x00\x12H\n\x0estart_activity\x18\x0b \x01(\x0b\x32..android_env.AdbResponse.StartActivityResponseH\x00\x12\x44\n\x0cpress_button\x18\x0c \x01(\x0b\x32,.android_env.AdbResponse.PressButtonResponseH\x00\x12\x35\n\x04push\x18\r \x01(\x0b\x32%.android_env.AdbResponse.PushResponseH\x00\x12\x35\n\x04pull\x18\x0e \x01(\x0b\x32%.android_env.AdbResponse.PullResponseH\x00\x12@\n\ninput_text\x18\x0f \x01(\x0b\x32*.android_env.AdbResponse.InputTextResponseH\x00\x12=\n\x08settings\x18\x10 \x01(\x0b\x32).android_env.AdbResponse.SettingsResponseH\x00\x12;\n\x07generic\x18\x11 \x01(\x0b\x32(.android_env.AdbResponse.GenericResponseH\x00\x12J\n\x0fpackage_manager\x18\x12 \x01(\x0b\x32/.android_env.AdbResponse.PackageManagerResponseH\x00\x12J\n\x0fget_orientation\x18\x13 \x01(\x0b\x32/.android_env.AdbResponse.GetOrientationResponseH\x00\x12;\n\x07\x64umpsys\x18\x15 \x01(\x0b\x32(.android_env.AdbResponse.DumpsysResponseH\x00\x1a,\n\nStatsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x02:\x02\x38\x01\x1a\x33\n\x1aGetCurrentActivityResponse\x12\x15\n\rfull_activity\x18\x01 \x01(\t\x1a-\n\x16GetOrientationResponse\x12\x13\n\x0borientation\x18\x01 \x01(\x05\x1a>\n\x15StartActivityResponse\x12\x15\n\rfull_activity\x18\x01 \x01(\t\x12\x0e\n\x06output\x18\x02 \x01(\x0c\x1a%\n\x13PressButtonResponse\x12\x0e\n\x06output\x18\x01 \x01(\x0c\x1a\x0e\n\x0cPushResponse\x1a\x1f\n\x0cPullResponse\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c\x1a\x13\n\x11InputTextResponse\x1a\"\n\x10SettingsResponse\x12\x0e\n\x06output\x18\x01 \x01(\x0c\x1a!\n\x0fGenericResponse\x12\x0e\n\x06output\x18\x01 \x01(\x0c\x1a\x8d\x01\n\x16PackageManagerResponse\x12\x0e\n\x06output\x18\x01 \x01(\x0c\x12\x44\n\x04list\x18\x02 \x01(\x0b\x32\x34.android_env.AdbResponse.PackageManagerResponse.ListH\x00\x1a\x15\n\x04List\x12\r\n\x05items\x18\x01 \x03(\tB\x06\n\x04verb\x1a!\n\x0f\x44umpsysResponse\x12\x0e\n\x06output\x18\x01 \x01(\x0c\"}\n\x06Status\x12\r\n\tUNDEFINED\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x13\n\x0fUNKNOWN_COMMAND\x10\x02\x12\x17\n\x13\x46\x41ILED_PRECONDITION\x10\x03\x12\x12\n\x0eINTERNAL_ERROR\x10\x04\x12\r\n\tADB_ERROR\x10\x05\x12\x0b\n\x07TIMEOUT\x10\x06\x42\t\n\x07payloadb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'android_env.proto.adb_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_ADBRESPONSE_STATSENTRY']._loaded_options = None
+  _globals['_ADBRESPONSE_STATSENTRY']._serialized_options = b'8\001'
+  _globals['_ADBREQUEST']._serialized_start=45
+  _globals['_ADBREQUEST']._serialized_end=3632
+  _globals['_ADBREQUEST_INSTALLAPK']._serialized_start=1131
+  _globals['_ADBREQUEST_INSTALLAPK']._serialized_end=1335
+  _globals['_ADBREQUEST_INSTALLAPK_FILESYSTEM']._serialized_start=1271
+  _globals['_ADBREQUEST_INSTALLAPK_FILESYSTEM']._serialized_end=1297
+  _globals['_ADBREQUEST_INSTALLAPK_BLOB']._serialized_start=1299
+  _globals['_ADBREQUEST_INSTALLAPK_BLOB']._serialized_end=1323
+  _globals['_ADBREQUEST_STARTACTIVITY']._serialized_start=1337
+  _globals['_ADBREQUEST_STARTACTIVITY']._serialized_end=1415
+  _globals['_ADBREQUEST_SENDBROADCAST']._serialized_start=1417
+  _globals['_ADBREQUEST_SENDBROADCAST']._serialized_end=1467
+  _globals['_ADBREQUEST_UNINSTALLPACKAGE']._serialized_start=1469
+  _globals['_ADBREQUEST_UNINSTALLPACKAGE']._serialized_end=1509
+  _globals['_ADBREQUEST_FORCESTOP']._serialized_start=1511
+  _globals['_ADBREQUEST_FORCESTOP']._serialized_end=1544
+  _globals['_ADBREQUEST_TAP']._serialized_start=1546
+  _globals['_ADBREQUEST_TAP']._serialized_end=1573
+  _globals['_ADBREQUEST_PRESSBUTTON']._serialized_start=1575
+  _globals['_ADBREQUEST_PRESSBUTTON']._serialized_end=1689
+  _globals['_ADBREQUEST_PRESSBUTTON_BUTTON']._serialized_start=1650
+  _globals['_ADBREQUEST_PRESSBUTTON_BUTTON']._serialized_end=1689
+  _globals['_ADBREQUEST_STARTSCREENPINNING']._serialized_start=1691
+  _globals['_ADBREQUEST_STARTSCREENPINNING']._serialized_end=1734
+  _globals['_ADBREQUEST_GETCURRENTACTIVITY']._serialized_start=1736
+  _globals['_ADBREQUEST_GETCURRENTACTIVITY']._serialized_end=1756
+  _globals['_ADBREQUEST_GETORIENTATIONREQUEST']._serialized_start=1758
+  _globals['_ADBREQUEST_GETORIENTATIONREQUEST']._serialized_end=1781
+  _globals['_ADBREQUEST_PUSH']._serialized_start=1783
+  _globals['_ADBREQUEST_PUSH']._serialized_end=1820
+  _globals['_ADBREQUEST_PULL']._serialized_start=1822
+  _globals['_ADBREQUEST_PULL']._serialized_end=1842
+  _globals['_ADBREQUEST_INPUTTEXT']._serialized_start=1844
+  _globals['_ADBREQUEST_INPUTTEXT']._serialized_end=1869
+  _globals['_ADBREQUEST_SETTINGSREQUEST']._serialized_start=1872
+  _globals['_ADBREQUEST_SETTINGSREQUEST']._serialized_end=2618
+  _globals['_ADBREQUEST_SETTINGSREQUEST_GET']._serialized_start=2278
+  _globals['_ADBREQUEST_SETTINGSREQUEST_GET']._serialized_end=2296
+  _globals['_ADBREQUEST_SETTINGSREQUEST_PUT']._serialized_start=2298
+  _globals['_ADBREQUEST_SETTINGSREQUEST_PUT']._serialized_end=2331
+  _globals['_ADBREQUEST_SETTINGSREQUEST_DELETE']._serialized_start=2333
+  _globals['_ADBREQUEST_SETTINGSREQUEST_DELETE']._serialized_end=2354
+  _globals['_ADBREQUEST_SETTINGSREQUEST_RESET']._serialized_start=2357
+  _globals['_ADBREQUEST_SETTINGSREQUEST_RESET']._serialized_end=2540
+  _globals['_ADBREQUEST_SETTINGSREQUEST_RESET_MODE']._serialized_start=2454
+  _globals['_ADBREQUEST_SETTINGSREQUEST_RESET_MODE']._serialized_end=2540
+  _globals['_ADBREQUEST_SETTINGSREQUEST_LIST']._serialized_start=2542
+  _globals['_ADBREQUEST_SETTINGSREQUEST_LIST']._serialized_end=2548
+  _globals['_ADBREQUEST_SETTINGSREQUEST_NAMESPACE']._serialized_start=2550
+  _globals['_ADBREQUEST_SETTINGSREQUEST_NAMESPACE']._serialized_end=2610
+  _globals['_ADBREQUEST_GENERICREQUEST']._serialized_start=2620
+  _globals['_ADBREQUEST_GENERICREQUEST']._serialized_end=2650
+  _globals['_ADBREQUEST_PACKAGEMANAGERREQUEST']._serialized_start=2653
+  _globals['_ADBREQUEST_PACKAGEMANAGERREQUEST']._serialized_end=3324
+  _globals['_ADBREQUEST_PACKAGEMANAGERREQUEST_LIST']._serialized_start=2887
+  _globals['_ADBREQUEST_PACKAGEMANAGERREQUEST_LIST']._serialized_end=3216
+  _globals['_ADBREQUEST_PACKAGEMANAGERREQUEST_LIST_FEATURES']._serialized_start=3140
+  _globals['_ADBREQUEST_PACKAGEMANAGERREQUEST_LIST_FEATURES']._serialized_end=3150
+  _globals['_ADBREQUEST_PACKAGEMANAGERREQUEST_LIST_LIBRARIES']._serialized_start=3152
+  _globals['_ADBREQUEST_PACKAGEMANAGERREQUEST_LIST_LIBRARIES']._serialized_end=3163
+  _globals['_ADBREQUEST_PACKAGEMANAGERREQUEST_LIST_PACKAGES']._serialized_start=3165
+  _globals['_ADBREQUEST_PACKAGEMANAGERREQUEST_LIST_PACKAGES']._serialized_end=3208
+  _globals['_ADBREQUEST_PACKAGEMANAGERREQUEST_CLEAR']._serialized_start=3218
+  _globals['_ADBREQUEST_PACKAGEMANAGERREQUEST_CLEAR']._serialized_end=3264
+  _globals['_ADBREQUEST_PACKAGEMANAGERREQUEST_GRANT']._serialized_start=3266
+  _globals['_ADBREQUEST_PACKAGEMANAGERREQUEST_GRANT']._serialized_end=3316
+  _globals['_ADBREQUEST_DUMPSYSREQUEST']._serialized_start=3327
+  _globals['_ADBREQUEST_DUMPSYSREQUEST']._serialized_end=3621
+  _globals['_ADBREQUEST_DUMPSYSREQUEST_PRIORITYLEVEL']._serialized_start=3559
+  _globals['_ADBREQUEST_DUMPSYSREQUEST_PRIORITYLEVEL']._serialized_end=3621
+  _globals['_ADBRESPONSE']._serialized_start=3635
+  _globals['_ADBRESPONSE']._serialized_end=5221
+  _globals['_ADBRESPONSE_STATSENTRY']._serialized_start=4516
+  _globals['_ADBRESPONSE_STATSENTRY']._serialized_end=4560
+  _globals['_ADBRESPONSE_GETCURRENTACTIVITYRESPONSE']._serialized_start=4562
+  _globals['_ADBRESPONSE_GETCURRENTACTIVITYRESPONSE']._serialized_end=4613
+  _globals['_ADBRESPONSE_GETORIENTATIONRESPONSE']._serialized_start=4615
+  _globals['_ADBRESPONSE_GETORIENTATIONRESPONSE']._serialized_end=4660
+  _globals['_ADBRESPONSE_STARTACTIVITYRESPONSE']._serialized_start=4662
+  _globals['_ADBRESPONSE_STARTACTIVITYRESPONSE']._serialized_end=4724
+  _globals['_ADBRESPONSE_PRESSBUTTONRESPONSE']._serialized_start=4726
+  _globals['_ADBRESPONSE_PRESSBUTTONRESPONSE']._serialized_end=4763
+  _globals['_ADBRESPONSE_PUSHRESPONSE']._serialized_start=4765
+  _globals['_ADBRESPONSE_PUSHRESPONSE']._serialized_end=4779
+  _globals['_ADBRESPONSE_PULLRESPONSE']._serialized_start=4781
+  _globals['_ADBRESPONSE_PULLRESPONSE']._serialized_end=4812
+  _globals['_ADBRESPONSE_INPUTTEXTRESPONSE']._serialized_start=4814
+  _globals['_ADBRESPONSE_INPUTTEXTRESPONSE']._serialized_end=4833
+  _globals['_ADBRESPONSE_SETTINGSRESPONSE']._serialized_start=4835
+  _globals['_ADBRESPONSE_SETTINGSRESPONSE']._serialized_end=4869
+  _globals['_ADBRESPONSE_GENERICRESPONSE']._serialized_start=4871
+  _globals['_ADBRESPONSE_GENERICRESPONSE']._serialized_end=4904
+  _globals['_ADBRESPONSE_PACKAGEMANAGERRESPONSE']._serialized_start=4907
+  _globals['_ADBRESPONSE_PACKAGEMANAGERRESPONSE']._serialized_end=5048
+  _globals['_ADBRESPONSE_PACKAGEMANAGERRESPONSE_LIST']._serialized_start=5019
+  _globals['_ADBRESPONSE_PACKAGEMANAGERRESPONSE_LIST']._serialized_end=5040
+  _globals['_ADBRESPONSE_DUMPSYSRESPONSE']._serialized_start=5050
+  _globals['_ADBRESPONSE_DUMPSYSRESPONSE']._serialized_end=5083
+  _globals['_ADBRESPONSE_STATUS']._serialized_start=5085
+  _globals['_ADBRESPONSE_STATUS']._serialized_end=5210
+# @@protoc_insertion_point(module_scope)
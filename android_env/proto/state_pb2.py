@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: android_env/proto/state.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'android_env/proto/state.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1d\x61ndroid_env/proto/state.proto\x12\x0b\x61ndroid_env\"v\n\x10SaveStateRequest\x12\x35\n\x04\x61rgs\x18\x01 \x03(\x0b\x32\'.android_env.SaveStateRequest.ArgsEntry\x1a+\n\tArgsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"v\n\x10LoadStateRequest\x12\x35\n\x04\x61rgs\x18\x01 \x03(\x0b\x32\'.android_env.LoadStateRequest.ArgsEntry\x1a+\n\tArgsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x91\x02\n\x11SaveStateResponse\x12\x35\n\x06status\x18\x01 \x01(\x0e\x32%.android_env.SaveStateResponse.Status\x12\x15\n\rerror_message\x18\x02 \x01(\t\x12K\n\x0f\x61\x64\x64itional_info\x18\x03 \x03(\x0b\x32\x32.android_env.SaveStateResponse.AdditionalInfoEntry\x1a\x35\n\x13\x41\x64\x64itionalInfoEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"*\n\x06Status\x12\r\n\tUNDEFINED\x10\x00\x12\x06\n\x02OK\x10\x01\x12\t\n\x05\x45RROR\x10\x02\"\xa0\x02\n\x11LoadStateResponse\x12\x35\n\x06status\x18\x01 \x01(\x0e\x32%.android_env.LoadStateResponse.Status\x12\x15\n\rerror_message\x18\x02 \x01(\t\x12K\n\x0f\x61\x64\x64itional_info\x18\x03 \x03(\x0b\x32\x32.android_env.LoadStateResponse.AdditionalInfoEntry\x1a\x35\n\x13\x41\x64\x64itionalInfoEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"9\n\x06Status\x12\r\n\tUNDEFINED\x10\x00\x12\x06\n\x02OK\x10\x01\x12\r\n\tNOT_FOUND\x10\x02\x12\t\n\x05\x45RROR\x10\x03\x42\x02P\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'android_env.proto.state_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001'
+  _globals['_SAVESTATEREQUEST_ARGSENTRY']._loaded_options = None
+  _globals['_SAVESTATEREQUEST_ARGSENTRY']._serialized_options = b'8\001'
+  _globals['_LOADSTATEREQUEST_ARGSENTRY']._loaded_options = None
+  _globals['_LOADSTATEREQUEST_ARGSENTRY']._serialized_options = b'8\001'
+  _globals['_SAVESTATERESPONSE_ADDITIONALINFOENTRY']._loaded_options = None
+  _globals['_SAVESTATERESPONSE_ADDITIONALINFOENTRY']._serialized_options = b'8\001'
+  _globals['_LOADSTATERESPONSE_ADDITIONALINFOENTRY']._loaded_options = None
+  _globals['_LOADSTATERESPONSE_ADDITIONALINFOENTRY']._serialized_options = b'8\001'
+  _globals['_SAVESTATEREQUEST']._serialized_start=46
+  _globals['_SAVESTATEREQUEST']._serialized_end=164
+  _globals['_SAVESTATEREQUEST_ARGSENTRY']._serialized_start=121
+  _globals['_SAVESTATEREQUEST_ARGSENTRY']._serialized_end=164
+  _globals['_LOADSTATEREQUEST']._serialized_start=166
+  _globals['_LOADSTATEREQUEST']._serialized_end=284
+  _globals['_LOADSTATEREQUEST_ARGSENTRY']._serialized_start=121
+  _globals['_LOADSTATEREQUEST_ARGSENTRY']._serialized_end=164
+  _globals['_SAVESTATERESPONSE']._serialized_start=287
+  _globals['_SAVESTATERESPONSE']._serialized_end=560
+  _globals['_SAVESTATERESPONSE_ADDITIONALINFOENTRY']._serialized_start=463
+  _globals['_SAVESTATERESPONSE_ADDITIONALINFOENTRY']._serialized_end=516
+  _globals['_SAVESTATERESPONSE_STATUS']._serialized_start=518
+  _globals['_SAVESTATERESPONSE_STATUS']._serialized_end=560
+  _globals['_LOADSTATERESPONSE']._serialized_start=563
+  _globals['_LOADSTATERESPONSE']._serialized_end=851
+  _globals['_LOADSTATERESPONSE_ADDITIONALINFOENTRY']._serialized_start=463
+  _globals['_LOADSTATERESPONSE_ADDITIONALINFOENTRY']._serialized_end=516
+  _globals['_LOADSTATERESPONSE_STATUS']._serialized_start=794
+  _globals['_LOADSTATERESPONSE_STATUS']._serialized_end=851
+# @@protoc_insertion_point(module_scope)
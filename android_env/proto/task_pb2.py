@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: android_env/proto/task.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'android_env/proto/task.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from android_env.proto import adb_pb2 as android__env_dot_proto_dot_adb__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1c\x61ndroid_env/proto/task.proto\x12\x0b\x61ndroid_env\x1a\x1b\x61ndroid_env/proto/adb.proto\":\n\tAppScreen\x12\x10\n\x08\x61\x63tivity\x18\x01 \x01(\t\x12\x1b\n\x13view_hierarchy_path\x18\x02 \x03(\t\"S\n\x10WaitForAppScreen\x12*\n\napp_screen\x18\x01 \x01(\x0b\x32\x16.android_env.AppScreen\x12\x13\n\x0btimeout_sec\x18\x02 \x01(\x02\"9\n\x0c\x43heckInstall\x12\x14\n\x0cpackage_name\x18\x01 \x01(\t\x12\x13\n\x0btimeout_sec\x18\x02 \x01(\x02\"\x19\n\x05Sleep\x12\x10\n\x08time_sec\x18\x01 \x01(\x02\"\xa2\x01\n\x10SuccessCondition\x12\x13\n\x0bnum_retries\x18\x01 \x01(\x05\x12<\n\x13wait_for_app_screen\x18\x02 \x01(\x0b\x32\x1d.android_env.WaitForAppScreenH\x00\x12\x32\n\rcheck_install\x18\x03 \x01(\x0b\x32\x19.android_env.CheckInstallH\x00\x42\x07\n\x05\x63heck\"\xa2\x01\n\tSetupStep\x12\x38\n\x11success_condition\x18\x01 \x01(\x0b\x32\x1d.android_env.SuccessCondition\x12.\n\x0b\x61\x64\x62_request\x18\x02 \x01(\x0b\x32\x17.android_env.AdbRequestH\x00\x12#\n\x05sleep\x18\x03 \x01(\x0b\x32\x12.android_env.SleepH\x00\x42\x06\n\x04step\"\xcf\x02\n\tArraySpec\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05shape\x18\x02 \x03(\x05\x12.\n\x05\x64type\x18\x03 \x01(\x0e\x32\x1f.android_env.ArraySpec.DataType\"\xf4\x01\n\x08\x44\x61taType\x12\x15\n\x11INVALID_DATA_TYPE\x10\x00\x12\t\n\x05\x46LOAT\x10\x01\x12\n\n\x06\x44OUBLE\x10\x02\x12\x08\n\x04INT8\x10\x03\x12\t\n\x05INT16\x10\x04\x12\t\n\x05INT32\x10\x05\x12\t\n\x05INT64\x10\x06\x12\t\n\x05UINT8\x10\x07\x12\n\n\x06UINT16\x10\x08\x12\n\n\x06UINT32\x10\t\x12\n\n\x06UINT64\x10\n\x12\x08\n\x04\x42OOL\x10\x0b\x12\r\n\tSTRING_U1\x10\x0c\x12\x0e\n\nSTRING_U16\x10\r\x12\x0e\n\nSTRING_U25\x10\x0e\x12\x0f\n\x0bSTRING_U250\x10\x0f\x12\n\n\x06STRING\x10\x10\x12\n\n\x06OBJECT\x10\x11\"\xc2\x02\n\x10LogParsingConfig\x12\x0f\n\x07\x66ilters\x18\x01 \x03(\t\x12=\n\x0blog_regexps\x18\x02 \x01(\x0b\x32(.android_env.LogParsingConfig.LogRegexps\x1a\xdd\x01\n\nLogRegexps\x12\r\n\x05score\x18\x01 \x01(\t\x12\x0e\n\x06reward\x18\x02 \x03(\t\x12\x13\n\x0b\x65pisode_end\x18\x03 \x03(\t\x12\r\n\x05\x65xtra\x18\x04 \x03(\t\x12\x12\n\njson_extra\x18\x05 \x03(\t\x12J\n\x0creward_event\x18\x06 \x03(\x0b\x32\x34.android_env.LogParsingConfig.LogRegexps.RewardEvent\x1a,\n\x0bRewardEvent\x12\r\n\x05\x65vent\x18\x01 \x01(\t\x12\x0e\n\x06reward\x18\x02 \x01(\x02\"\xe0\x02\n\x04Task\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12+\n\x0bsetup_steps\x18\x04 \x03(\x0b\x32\x16.android_env.SetupStep\x12+\n\x0breset_steps\x18\x05 \x03(\x0b\x32\x16.android_env.SetupStep\x12\x33\n\x13\x65xpected_app_screen\x18\x06 \x01(\x0b\x32\x16.android_env.AppScreen\x12\x17\n\x0fmax_episode_sec\x18\x07 \x01(\x02\x12\x19\n\x11max_episode_steps\x18\x08 \x01(\x05\x12\x39\n\x12log_parsing_config\x18\t \x01(\x0b\x32\x1d.android_env.LogParsingConfig\x12+\n\x0b\x65xtras_spec\x18\n \x03(\x0b\x32\x16.android_env.ArraySpecb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'android_env.proto.task_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_APPSCREEN']._serialized_start=74
+  _globals['_APPSCREEN']._serialized_end=132
+  _globals['_WAITFORAPPSCREEN']._serialized_start=134
+  _globals['_WAITFORAPPSCREEN']._serialized_end=217
+  _globals['_CHECKINSTALL']._serialized_start=219
+  _globals['_CHECKINSTALL']._serialized_end=276
+  _globals['_SLEEP']._serialized_start=278
+  _globals['_SLEEP']._serialized_end=303
+  _globals['_SUCCESSCONDITION']._serialized_start=306
+  _globals['_SUCCESSCONDITION']._serialized_end=468
+  _globals['_SETUPSTEP']._serialized_start=471
+  _globals['_SETUPSTEP']._serialized_end=633
+  _globals['_ARRAYSPEC']._serialized_start=636
+  _globals['_ARRAYSPEC']._serialized_end=971
+  _globals['_ARRAYSPEC_DATATYPE']._serialized_start=727
+  _globals['_ARRAYSPEC_DATATYPE']._serialized_end=971
+  _globals['_LOGPARSINGCONFIG']._serialized_start=974
+  _globals['_LOGPARSINGCONFIG']._serialized_end=1296
+  _globals['_LOGPARSINGCONFIG_LOGREGEXPS']._serialized_start=1075
+  _globals['_LOGPARSINGCONFIG_LOGREGEXPS']._serialized_end=1296
+  _globals['_LOGPARSINGCONFIG_LOGREGEXPS_REWARDEVENT']._serialized_start=1252
+  _globals['_LOGPARSINGCONFIG_LOGREGEXPS_REWARDEVENT']._serialized_end=1296
+  _globals['_TASK']._serialized_start=1299
+  _globals['_TASK']._serialized_end=1651
+# @@protoc_insertion_point(module_scope)
@@ -56,13 +56,13 @@ class FloatPixelsWrapper(base_wrapper.BaseWrapper):
     return self._process_timestep(self._env.step(action))
 
   def observation_spec(self) -> dict[str, specs.Array]:
+    observation_spec = self._env.observation_spec()
     if self._should_convert_int_to_float:
-      observation_spec = self._env.observation_spec()
+      pixels_spec = observation_spec['pixels']
       observation_spec['pixels'] = specs.BoundedArray(
-          shape=self._env.observation_spec()['pixels'].shape,
+          shape=pixels_spec.shape,
           dtype=np.float32,
           minimum=0.0,
           maximum=1.0,
-          name=self._env.observation_spec()['pixels'].name)
-      return observation_spec
-    return self._env.observation_spec()
+          name=pixels_spec.name)
+    return observation_spec
@@ -76,10 +76,12 @@ class ImageRescaleWrapper(base_wrapper.BaseWrapper):
     """Resize color or grayscale/action_layer array to new_shape."""
     assert new_shape.ndim == 1
     assert len(new_shape) == 2
+    # Frames coming from the simulator are already uint8, so avoid copying the
+    # full-resolution image just to cast it.
     resized_array = np.array(
-        Image.fromarray(grayscale_or_rbg_array.astype('uint8')).resize(
-            tuple(new_shape)
-        )
+        Image.fromarray(
+            grayscale_or_rbg_array.astype(np.uint8, copy=False)
+        ).resize(tuple(new_shape))
     )
     if resized_array.ndim == 2:
       return np.expand_dims(resized_array, axis=-1)
@@ -36,7 +36,7 @@ def _simple_spec():
 
 
 def _simple_timestep():
-  observation = np.ones(shape=[300, 300, 3])
+  observation = np.ones(shape=[300, 300, 3], dtype=np.uint8)
   return dm_env.TimeStep(
       step_type=dm_env.StepType.MID,
       reward=3.14,
@@ -74,7 +74,7 @@ class RateLimitWrapper(base_wrapper.BaseWrapper):
 
   def reset(self):
     timestep = self._env.reset()
-    self._last_step_time = time.time()
+    self._last_step_time = time.monotonic()
     return timestep
 
   def step(self, action: dict[str, np.ndarray]) -> dm_env.TimeStep:
@@ -105,13 +105,14 @@ class RateLimitWrapper(base_wrapper.BaseWrapper):
     elif self._sleep_type == RateLimitWrapper.SleepType.AFTER:
       self._wait()
 
-    self._last_step_time = time.time()
+    self._last_step_time = time.monotonic()
 
     return timestep
 
   def _wait(self) -> None:
-    if self._max_wait > 0.0 and self._last_step_time is not None:
-      time_since_step = time.time() - self._last_step_time
+    # Only called from `step()` after it has returned early if disabled.
+    if self._last_step_time is not None:
+      time_since_step = time.monotonic() - self._last_step_time
       sec_to_wait = self._max_wait - time_since_step
       if sec_to_wait > 0.0:
         time.sleep(sec_to_wait)
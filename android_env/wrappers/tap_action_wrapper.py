@@ -35,6 +35,17 @@ class TapActionWrapper(base_wrapper.BaseWrapper):
     self._touch_only = touch_only
     self._num_frames = num_frames
     self._env_steps = 0
+    # The `action_type`s this wrapper injects are constant, so they are created
+    # once here (as read-only arrays) instead of on every step.
+    action_type_dtype = self.action_spec()['action_type'].dtype
+    self._touch_action_type = np.array(
+        action_type.ActionType.TOUCH, dtype=action_type_dtype
+    )
+    self._touch_action_type.flags.writeable = False
+    self._lift_action_type = np.array(
+        action_type.ActionType.LIFT, dtype=action_type_dtype
+    )
+    self._lift_action_type.flags.writeable = False
 
   def stats(self):
     """Returns a dictionary of metrics logged by the environment."""
@@ -48,23 +59,17 @@ class TapActionWrapper(base_wrapper.BaseWrapper):
     if self._touch_only:
       assert action['action_type'] == 0
       touch_action = action.copy()
-      touch_action['action_type'] = np.array(
-          action_type.ActionType.TOUCH
-      ).astype(self.action_spec()['action_type'].dtype)
+      touch_action['action_type'] = self._touch_action_type
       actions = [touch_action] * self._num_frames
       lift_action = action.copy()
-      lift_action['action_type'] = np.array(action_type.ActionType.LIFT).astype(
-          self.action_spec()['action_type'].dtype
-      )
+      lift_action['action_type'] = self._lift_action_type
       actions.append(lift_action)
 
     else:
       if action['action_type'] == action_type.ActionType.TOUCH:
         actions = [action] * self._num_frames
         lift_action = action.copy()
-        lift_action['action_type'] = np.array(
-            action_type.ActionType.LIFT
-        ).astype(self.action_spec()['action_type'].dtype)
+        lift_action['action_type'] = self._lift_action_type
         actions.append(lift_action)
       else:
         actions = [action] * (self._num_frames + 1)
@@ -41,6 +41,9 @@ flags.DEFINE_string('task_path', None, 'Path to task textproto file.')
 
 # Experiment args.
 flags.DEFINE_integer('num_steps', 1000, 'Number of steps to take.')
+flags.DEFINE_integer(
+    'log_every', 50, 'Number of steps between log lines.', lower_bound=1
+)
 
 
 def main(_):
@@ -63,24 +66,28 @@ def main(_):
   with loader.load(config) as env:
 
     action_spec = env.action_spec()
+    rng = np.random.default_rng()
 
-    def get_random_action() -> dict[str, np.ndarray]:
-      """Returns a random AndroidEnv action."""
-      action = {}
-      for k, v in action_spec.items():
-        if isinstance(v, specs.DiscreteArray):
-          action[k] = np.random.randint(low=0, high=v.num_values, dtype=v.dtype)
-        else:
-          action[k] = np.random.random(size=v.shape).astype(v.dtype)
-      return action
+    # Draw the random actions for all steps up front, with a single vectorized
+    # call per action key, instead of sampling every key at every step.
+    random_actions = {}
+    for k, v in action_spec.items():
+      if isinstance(v, specs.DiscreteArray):
+        random_actions[k] = rng.integers(
+            low=0, high=v.num_values, size=FLAGS.num_steps, dtype=v.dtype
+        )
+      else:
+        random_actions[k] = rng.random(size=(FLAGS.num_steps, *v.shape)).astype(
+            v.dtype, copy=False
+        )
 
     _ = env.reset()
 
     for step in range(FLAGS.num_steps):
-      action = get_random_action()
+      action = {k: v[step] for k, v in random_actions.items()}
       timestep = env.step(action=action)
-      reward = timestep.reward
-      logging.info('Step %r, action: %r, reward: %r', step, action, reward)
+      if step % FLAGS.log_every == 0:
+        logging.info('Step %d, reward: %r', step, timestep.reward)
 
 
 if __name__ == '__main__':
@@ -43,40 +43,85 @@ _ANDROID_ENV_PROTOS = (
     'android_env/proto/a11y/android_accessibility_window_info.proto',
     'android_env/proto/a11y/rect.proto',
 )
+# Absolute paths of `_ANDROID_ENV_PROTOS`, as passed to protoc.
+_ANDROID_ENV_PROTO_PATHS = tuple(
+    os.path.join(_ROOT_DIR, proto_path) for proto_path in _ANDROID_ENV_PROTOS
+)
+
+# `.pyi` type stubs are only useful for development (type checkers, IDEs), so
+# they are only generated when `ANDROID_ENV_BUILD_PYI=1` is set.
+_BUILD_PYI = os.environ.get('ANDROID_ENV_BUILD_PYI', '0') == '1'
+
+# Suffixes of the files that protoc generates for each `.proto` file.
+_GENERATED_SUFFIXES = ('_pb2.py', '_pb2_grpc.py') + (
+    ('_pb2.pyi',) if _BUILD_PYI else ()
+)
+
+
+def _is_up_to_date(proto_path: str) -> bool:
+  """Returns True if all bindings of `proto_path` are newer than the proto."""
+
+  stem = proto_path[: -len('.proto')]
+  try:
+    generated_mtime = min(
+        os.path.getmtime(stem + suffix) for suffix in _GENERATED_SUFFIXES
+    )
+    return generated_mtime >= os.path.getmtime(proto_path)
+  except OSError:  # Some bindings have not been generated yet.
+    return False
 
 
 class _GenerateProtoFiles(setuptools.Command):
   """Command to generate protobuf bindings for AndroidEnv protos."""
 
   descriptions = 'Generates Python protobuf bindings for AndroidEnv protos.'
-  user_options = []
+  user_options = [
+      ('force', 'f', 'Regenerate bindings even if they are up to date.'),
+  ]
+  boolean_options = ['force']
 
   def initialize_options(self):
-    pass
+    self.force = False
 
   def finalize_options(self):
     pass
 
   def run(self):
-    # Import grpc_tools here, after setuptools has installed setup_requires
-    # dependencies.
+    # Only regenerate bindings that are older than their `.proto` file. The
+    # generated code only embeds its own file's descriptor (imports are
+    # referenced by module name), so changes to an import do not make it stale.
+    stale_protos = [
+        proto_path
+        for proto_path in _ANDROID_ENV_PROTO_PATHS
+        if self.force or not _is_up_to_date(proto_path)
+    ]
+    if not stale_protos:
+      self.announce('Protobuf bindings are up to date.', level=2)
+      return
+
+    # Import grpc_tools here, since it is only a build-time dependency (see
+    # `build-system.requires` in pyproject.toml).
     from grpc_tools import protoc  # pylint: disable=g-import-not-at-top
 
+    # Resolve grpc_tools' bundled protos once and keep the path alive while
+    # protoc runs: `as_file()` may extract them to a temporary directory that
+    # is removed when the context exits.
     with importlib.resources.as_file(
         importlib.resources.files('grpc_tools').joinpath('_proto')
-    ) as path:
-      grpc_protos_include = str(path)
-
-    for proto_path in _ANDROID_ENV_PROTOS:
+    ) as grpc_protos_include:
+      # Compile all protos in a single protoc invocation so that shared imports
+      # (e.g. the a11y protos) are parsed once and the code generators are only
+      # started once.
       proto_args = [
           'grpc_tools.protoc',
           '--proto_path={}'.format(grpc_protos_include),
           '--proto_path={}'.format(_ROOT_DIR),
           '--python_out={}'.format(_ROOT_DIR),
-          '--pyi_out={}'.format(_ROOT_DIR),
           '--grpc_python_out={}'.format(_ROOT_DIR),
-          os.path.join(_ROOT_DIR, proto_path),
       ]
+      if _BUILD_PYI:
+        proto_args.append('--pyi_out={}'.format(_ROOT_DIR))
+      proto_args.extend(stale_protos)
       if protoc.main(proto_args) != 0:
         raise RuntimeError('ERROR: {}'.format(proto_args))
 
@@ -100,7 +145,6 @@ setup(
     packages=find_packages(exclude=['examples']),
     package_data={'': ['proto/*.proto']},  # Copy protobuf files.
     include_package_data=True,
-    setup_requires=['grpcio-tools'],
     cmdclass={
         'build_ext': _BuildExt,
         'build_py': _BuildPy,